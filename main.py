@@ -5,18 +5,11 @@ YrYr Asset Sync - メインアプリケーション
 """
 
 import sys
-import os
-from pathlib import Path
-
-# src ディレクトリをパスに追加
-current_dir = Path(__file__).parent
-src_dir = current_dir / "src"
-sys.path.insert(0, str(src_dir))
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QTranslator, QLocale
-from ui.main_window import MainWindow
-from utils.logger import setup_logger
+from src.ui.main_window import MainWindow
+from src.utils.logger import setup_logger
 
 def main():
     """メインアプリケーション"""
@@ -2,14 +2,26 @@
 設定管理クラス
 """
 
-import json
 import os
 import uuid
+from collections import OrderedDict, deque
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
 
-from config.models import AppSettings, ProjectSettings, FolderPair, FilterRule, to_dict, from_dict
+from .models import AppSettings, ProjectSettings, FolderPair, FilterRule, to_dict, from_dict
+from ..utils.json_utils import json_dumps, json_loads
+
+
+def _write_file_atomic(file_path: Path, data: bytes):
+    """一時ファイルに書き込み・fsync してから置き換え（書き込み途中の破損を防止）"""
+    tmp_file = file_path.with_name(file_path.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, file_path)
 
 
 class ConfigManager:
@@ -25,34 +37,120 @@ class ConfigManager:
         self.data_dir = Path(data_dir)
         self.projects_dir = self.data_dir / "projects"
         self.config_file = self.data_dir / "config.json"
+        self.project_index_file = self.data_dir / "projects_index.json"
+        
+        # ディレクトリ作成（projects_dir は data_dir 配下なので1回で両方作成）
+        os.makedirs(self.projects_dir, exist_ok=True)
         
-        # ディレクトリ作成
-        self.data_dir.mkdir(exist_ok=True)
-        self.projects_dir.mkdir(exist_ok=True)
+        # 最後に書き込んだ設定内容（変更がなければ保存をスキップ）
+        self._last_config_bytes: Optional[bytes] = None
+        
+        # deferred_save() ブロック内ではアプリ設定の保存をまとめる
+        self._save_defer_depth = 0
+        self._save_pending = False
         
         # 設定ロード
         self.app_settings = self._load_app_settings()
+        self._project_index = self._load_project_index()
+        
+        # ロード済みプロジェクトのLRUキャッシュ（project_id -> ((mtime_ns, size), ProjectSettings)）
+        self._project_cache: "OrderedDict[str, Tuple[Tuple[int, int], ProjectSettings]]" = OrderedDict()
+        self._project_cache_size = 32
+        
+        # 最近使用したプロジェクト（最大10件）・フォルダ（最大20件）
+        self._recent_projects: Deque[str] = deque(self.app_settings.recent_projects[:10], maxlen=10)
+        self._recent_project_set: Set[str] = set(self._recent_projects)
+        self._recent_folders: Deque[str] = deque(self.app_settings.recent_folders[:20], maxlen=20)
+        self._recent_folder_set: Set[str] = set(self._recent_folders)
     
     def _load_app_settings(self) -> AppSettings:
         """アプリケーション設定をロード"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    self._last_config_bytes = f.read()
+                data = json_loads(self._last_config_bytes)
                 return from_dict(AppSettings, data)
             except Exception as e:
                 print(f"設定ファイル読み込みエラー: {e}")
         
         return AppSettings()
     
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """ブロック内の save_app_settings 呼び出しを終了時の1回の書き込みにまとめる"""
+        self._save_defer_depth += 1
+        try:
+            yield
+        finally:
+            self._save_defer_depth -= 1
+            if self._save_defer_depth == 0 and self._save_pending:
+                self.save_app_settings()
+    
     def save_app_settings(self):
         """アプリケーション設定を保存"""
+        if self._save_defer_depth > 0:
+            self._save_pending = True
+            return
+        
+        self._save_pending = False
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(to_dict(self.app_settings), f, ensure_ascii=False, indent=2)
+            data = json_dumps(to_dict(self.app_settings), indent=False)
+            if data == self._last_config_bytes:
+                return
+            
+            _write_file_atomic(self.config_file, data)
+            self._last_config_bytes = data
         except Exception as e:
             print(f"設定ファイル保存エラー: {e}")
     
+    def _load_project_index(self) -> Dict[str, Dict[str, str]]:
+        """プロジェクト一覧インデックスをロード（プロジェクトファイルとの差分を補正）"""
+        index = {}
+        if self.project_index_file.exists():
+            try:
+                with open(self.project_index_file, 'rb') as f:
+                    index = json_loads(f.read())
+            except Exception as e:
+                print(f"プロジェクトインデックス読み込みエラー: {e}")
+                index = {}
+        
+        # ファイル一覧とインデックスが一致しない場合のみ補正
+        project_ids = {project_file.stem for project_file in self.projects_dir.glob("*.json")}
+        if set(index) == project_ids:
+            return index
+        
+        index = {project_id: entry for project_id, entry in index.items() if project_id in project_ids}
+        for project_id in project_ids - set(index):
+            project_file = self.projects_dir / f"{project_id}.json"
+            try:
+                with open(project_file, 'rb') as f:
+                    data = json_loads(f.read())
+                index[project_id] = self._make_index_entry(data)
+            except Exception as e:
+                print(f"プロジェクト情報読み込みエラー: {e}")
+        
+        self._save_project_index(index)
+        return index
+    
+    def _save_project_index(self, index: Dict[str, Dict[str, str]]):
+        """プロジェクト一覧インデックスを保存"""
+        try:
+            _write_file_atomic(self.project_index_file, json_dumps(index, indent=False))
+        except Exception as e:
+            print(f"プロジェクトインデックス保存エラー: {e}")
+    
+    @staticmethod
+    def _make_index_entry(data: Dict) -> Dict[str, str]:
+        """プロジェクトデータから一覧表示用の情報を抽出"""
+        return {
+            'id': data.get('id', ''),
+            'name': data.get('name', ''),
+            'description': data.get('description', ''),
+            'created_at': data.get('created_at', ''),
+            'updated_at': data.get('updated_at', '')
+        }
+    
     def create_project(self, name: str, description: str = "") -> ProjectSettings:
         """新しいプロジェクトを作成"""
         project_id = str(uuid.uuid4())
@@ -65,27 +163,50 @@ class ConfigManager:
         return project
     
     def load_project(self, project_id: str) -> Optional[ProjectSettings]:
-        """プロジェクトをロード"""
+        """プロジェクトをロード（ファイルが変更されていなければキャッシュを返す）"""
         project_file = self.projects_dir / f"{project_id}.json"
-        if not project_file.exists():
+        try:
+            stat = project_file.stat()
+        except OSError:
+            self._project_cache.pop(project_id, None)
             return None
         
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._project_cache.get(project_id)
+        if cached and cached[0] == file_key:
+            self._project_cache.move_to_end(project_id)
+            return cached[1]
+        
         try:
-            with open(project_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return from_dict(ProjectSettings, data)
+            with open(project_file, 'rb') as f:
+                data = json_loads(f.read())
+            project = from_dict(ProjectSettings, data)
+            self._cache_project(project_id, file_key, project)
+            return project
         except Exception as e:
             print(f"プロジェクトファイル読み込みエラー: {e}")
             return None
     
+    def _cache_project(self, project_id: str, file_key: Tuple[int, int], project: ProjectSettings):
+        """プロジェクトをキャッシュに登録（上限を超えたら最も古いものを削除）"""
+        self._project_cache[project_id] = (file_key, project)
+        self._project_cache.move_to_end(project_id)
+        while len(self._project_cache) > self._project_cache_size:
+            self._project_cache.popitem(last=False)
+    
     def save_project(self, project: ProjectSettings):
         """プロジェクトを保存"""
         project.updated_at = datetime.now().isoformat()
         project_file = self.projects_dir / f"{project.id}.json"
         
         try:
-            with open(project_file, 'w', encoding='utf-8') as f:
-                json.dump(to_dict(project), f, ensure_ascii=False, indent=2)
+            data = to_dict(project)
+            _write_file_atomic(project_file, json_dumps(data, indent=False))
+            
+            stat = project_file.stat()
+            self._cache_project(project.id, (stat.st_mtime_ns, stat.st_size), project)
+            self._project_index[project.id] = self._make_index_entry(data)
+            self._save_project_index(self._project_index)
         except Exception as e:
             print(f"プロジェクトファイル保存エラー: {e}")
     
@@ -95,9 +216,14 @@ class ConfigManager:
         try:
             if project_file.exists():
                 project_file.unlink()
+                self._project_cache.pop(project_id, None)
+                if self._project_index.pop(project_id, None) is not None:
+                    self._save_project_index(self._project_index)
                 # 最近使用したプロジェクトからも削除
-                if project_id in self.app_settings.recent_projects:
-                    self.app_settings.recent_projects.remove(project_id)
+                if project_id in self._recent_project_set:
+                    self._recent_project_set.discard(project_id)
+                    self._recent_projects.remove(project_id)
+                    self.app_settings.recent_projects = list(self._recent_projects)
                     self.save_app_settings()
                 return True
         except Exception as e:
@@ -106,54 +232,57 @@ class ConfigManager:
     
     def list_projects(self) -> List[Dict[str, str]]:
         """プロジェクト一覧を取得"""
-        projects = []
-        for project_file in self.projects_dir.glob("*.json"):
-            try:
-                with open(project_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                projects.append({
-                    'id': data.get('id', ''),
-                    'name': data.get('name', ''),
-                    'description': data.get('description', ''),
-                    'created_at': data.get('created_at', ''),
-                    'updated_at': data.get('updated_at', '')
-                })
-            except Exception as e:
-                print(f"プロジェクト情報読み込みエラー: {e}")
+        projects = [dict(entry) for entry in self._project_index.values()]
         
         # 更新日時でソート
         projects.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
         return projects
     
+    @staticmethod
+    def _push_recent(recent: Deque[str], members: Set[str], value: str) -> List[str]:
+        """最近使用リストの先頭に追加（重複は移動、上限超過分は末尾から削除）"""
+        if value in members:
+            recent.remove(value)
+        elif len(recent) == recent.maxlen:
+            members.discard(recent.pop())
+        
+        members.add(value)
+        recent.appendleft(value)
+        return list(recent)
+    
     def add_recent_project(self, project_id: str):
         """最近使用したプロジェクトに追加"""
-        if project_id in self.app_settings.recent_projects:
-            self.app_settings.recent_projects.remove(project_id)
-        
-        self.app_settings.recent_projects.insert(0, project_id)
-        
-        # 最大10件まで保持
-        if len(self.app_settings.recent_projects) > 10:
-            self.app_settings.recent_projects = self.app_settings.recent_projects[:10]
+        # 既に先頭なら並び替え・保存は不要
+        if self._recent_projects and self._recent_projects[0] == project_id:
+            return
         
+        self.app_settings.recent_projects = self._push_recent(
+            self._recent_projects, self._recent_project_set, project_id
+        )
         self.save_app_settings()
     
     def add_recent_folder(self, folder_path: str):
         """最近開いたフォルダに追加"""
-        if folder_path in self.app_settings.recent_folders:
-            self.app_settings.recent_folders.remove(folder_path)
-        
-        self.app_settings.recent_folders.insert(0, folder_path)
-        
-        # 最大20件まで保持
-        if len(self.app_settings.recent_folders) > 20:
-            self.app_settings.recent_folders = self.app_settings.recent_folders[:20]
+        # 既に先頭なら並び替え・保存は不要
+        if self._recent_folders and self._recent_folders[0] == folder_path:
+            return
         
+        self.app_settings.recent_folders = self._push_recent(
+            self._recent_folders, self._recent_folder_set, folder_path
+        )
         self.save_app_settings()
     
-    def create_folder_pair(self, project_id: str, name: str, source_path: str, target_path: str) -> Optional[FolderPair]:
-        """フォルダペアを作成"""
-        project = self.load_project(project_id)
+    def create_folder_pair(
+        self,
+        project_id: str,
+        name: str,
+        source_path: str,
+        target_path: str,
+        project: Optional[ProjectSettings] = None
+    ) -> Optional[FolderPair]:
+        """フォルダペアを作成（ロード済みの project を渡すと再読み込みしない）"""
+        if project is None:
+            project = self.load_project(project_id)
         if not project:
             return None
         
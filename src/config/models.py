@@ -3,12 +3,18 @@
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Any, get_type_hints, get_origin, get_args
 from datetime import datetime
+import functools
 import json
+import sys
 
 
-@dataclass
+# Python 3.10 以降は __slots__ 付きで生成（3.9 では通常の dataclass）
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FilterRule:
     """フィルタ設定"""
     include_patterns: List[str] = field(default_factory=list)  # 包含パターン
@@ -16,7 +22,7 @@ class FilterRule:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FileMappingRule:
     """ファイル個別マッピングルール"""
     id: str
@@ -26,7 +32,7 @@ class FileMappingRule:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FileRenameRule:
     """ファイルリネームルール"""
     id: str
@@ -36,7 +42,7 @@ class FileRenameRule:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FolderPair:
     """フォルダペア設定"""
     id: str
@@ -53,13 +59,13 @@ class FolderPair:
     category: str = "未分類"  # カテゴリ
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CategorySettings:
     """カテゴリ設定"""
     categories: List[str] = field(default_factory=lambda: ["未分類", "UI", "背景", "キャラクター", "エフェクト"])
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProjectSettings:
     """プロジェクト設定"""
     id: str
@@ -72,7 +78,7 @@ class ProjectSettings:
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AppSettings:
     """アプリケーション全体設定"""
     version: str = "1.0.0"
@@ -86,7 +92,7 @@ class AppSettings:
     language: str = "ja"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SyncResult:
     """同期結果"""
     success: bool
@@ -98,20 +104,43 @@ class SyncResult:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+# フィールド変換の種類
+_FIELD_PLAIN = 0  # そのまま
+_FIELD_DATACLASS = 1  # ネストしたdataclass
+_FIELD_DATACLASS_LIST = 2  # dataclassのリスト
+
+
+@functools.lru_cache(maxsize=None)
+def _field_codecs(data_class) -> Tuple[Tuple[str, int, Any], ...]:
+    """dataclassのフィールド変換方法を解決（クラスごとに1回だけ実行）"""
+    type_hints = get_type_hints(data_class)
+    codecs = []
+    for field_name in data_class.__dataclass_fields__:
+        field_type = type_hints.get(field_name)
+        if hasattr(field_type, '__dataclass_fields__'):
+            codecs.append((field_name, _FIELD_DATACLASS, field_type))
+        elif get_origin(field_type) is list and hasattr(get_args(field_type)[0], '__dataclass_fields__'):
+            codecs.append((field_name, _FIELD_DATACLASS_LIST, get_args(field_type)[0]))
+        else:
+            codecs.append((field_name, _FIELD_PLAIN, None))
+    return tuple(codecs)
+
+
 def to_dict(obj) -> Dict:
     """dataclassをdictに変換"""
-    if hasattr(obj, '__dataclass_fields__'):
-        result = {}
-        for field_name, field_def in obj.__dataclass_fields__.items():
-            value = getattr(obj, field_name)
-            if hasattr(value, '__dataclass_fields__'):
-                result[field_name] = to_dict(value)
-            elif isinstance(value, list):
-                result[field_name] = [to_dict(item) if hasattr(item, '__dataclass_fields__') else item for item in value]
-            else:
-                result[field_name] = value
-        return result
-    return obj
+    if not hasattr(obj, '__dataclass_fields__'):
+        return obj
+    
+    result = {}
+    for field_name, kind, _ in _field_codecs(type(obj)):
+        value = getattr(obj, field_name)
+        if kind == _FIELD_DATACLASS:
+            result[field_name] = to_dict(value)
+        elif kind == _FIELD_DATACLASS_LIST:
+            result[field_name] = [to_dict(item) for item in value]
+        else:
+            result[field_name] = value
+    return result
 
 
 def from_dict(data_class, data: Dict):
@@ -119,21 +148,16 @@ def from_dict(data_class, data: Dict):
     if not isinstance(data, dict):
         return data
     
-    field_types = {f.name: f.type for f in data_class.__dataclass_fields__.values()}
     kwargs = {}
+    for field_name, kind, item_type in _field_codecs(data_class):
+        if field_name not in data:
+            continue
+        value = data[field_name]
+        if kind == _FIELD_DATACLASS:
+            kwargs[field_name] = from_dict(item_type, value)
+        elif kind == _FIELD_DATACLASS_LIST:
+            kwargs[field_name] = [from_dict(item_type, item) for item in value]
+        else:
+            kwargs[field_name] = value
     
-    for key, value in data.items():
-        if key in field_types:
-            field_type = field_types[key]
-            if hasattr(field_type, '__dataclass_fields__'):
-                kwargs[key] = from_dict(field_type, value)
-            elif hasattr(field_type, '__origin__') and field_type.__origin__ is list:
-                item_type = field_type.__args__[0]
-                if hasattr(item_type, '__dataclass_fields__'):
-                    kwargs[key] = [from_dict(item_type, item) for item in value]
-                else:
-                    kwargs[key] = value
-            else:
-                kwargs[key] = value
-    
-    return data_class(**kwargs)
\ No newline at end of file
+    return data_class(**kwargs)
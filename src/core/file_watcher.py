@@ -2,11 +2,15 @@
 ファイル監視機能
 """
 
+import heapq
+import logging
+import os
+import queue
 import time
 from pathlib import Path
-from typing import Dict, List, Callable, Optional, Set
+from typing import Dict, List, Callable, Optional, Set, Tuple
 from threading import Thread, Lock
-from datetime import datetime, timedelta
+from datetime import datetime
 
 try:
     from watchdog.observers import Observer
@@ -20,9 +24,13 @@ except ImportError:
     FileCreatedEvent = None
     FileDeletedEvent = None
 
-from config.models import FolderPair
-from utils.logger import get_logger
-from utils.file_utils import match_patterns
+from ..config.models import FolderPair
+from ..utils.logger import get_logger
+from ..utils.file_utils import FileFilter
+
+
+# モジュール共通のロガー
+_logger = get_logger()
 
 
 class WatchEvent:
@@ -43,27 +51,37 @@ if WATCHDOG_AVAILABLE:
             super().__init__()
             self.file_watcher = file_watcher
             self.folder_pair = folder_pair
-            self.logger = get_logger()
+            self.logger = _logger
+            
+            # コンパイル済みフィルタ（パターン変更時に再生成）
+            self._file_filter: Optional[FileFilter] = None
+            self._filter_key: Optional[tuple] = None
             
-            # デバウンス用
-            self._recent_events: Dict[str, datetime] = {}
+            # デバウンス用（ファイルパス -> 最終イベント時刻[time.monotonic]）
+            self._recent_events: Dict[str, float] = {}
+            # 期限切れ判定用の (イベント時刻, ファイルパス) ヒープ（古いエントリは遅延削除）
+            self._expiry_heap: List[Tuple[float, str]] = []
             self._debounce_seconds = 2.0
+            self._max_recent_events = 10000
             self._lock = Lock()
         
-        def _should_process_file(self, file_path: str) -> bool:
-            """ファイルを処理対象とするかチェック"""
-            path = Path(file_path)
-            
-            # ディレクトリは無視
-            if path.is_dir():
+        def _get_file_filter(self) -> FileFilter:
+            """コンパイル済みフィルタを取得"""
+            filter_rule = self.folder_pair.filter_rule
+            filter_key = (tuple(filter_rule.include_patterns), tuple(filter_rule.exclude_patterns))
+            if filter_key != self._filter_key:
+                self._file_filter = FileFilter(*filter_key)
+                self._filter_key = filter_key
+            return self._file_filter
+        
+        def _should_process_file(self, event) -> bool:
+            """イベントのファイルを処理対象とするかチェック"""
+            # ディレクトリは無視（イベント情報で判定し stat を発行しない）
+            if event.is_directory:
                 return False
             
             # フィルタチェック
-            if not match_patterns(
-                path,
-                self.folder_pair.filter_rule.include_patterns,
-                self.folder_pair.filter_rule.exclude_patterns
-            ):
+            if not self._get_file_filter().matches(os.path.basename(event.src_path)):
                 return False
             
             return True
@@ -71,59 +89,62 @@ if WATCHDOG_AVAILABLE:
         def _debounce_event(self, file_path: str) -> bool:
             """デバウンス処理（短時間の重複イベントを除去）"""
             with self._lock:
-                now = datetime.now()
+                now = time.monotonic()
+                
+                # 古いエントリを清理（ヒープから期限切れ分のみ取り出す）
+                cutoff_time = now - self._debounce_seconds * 2
+                heap = self._expiry_heap
+                while heap and (heap[0][0] < cutoff_time or len(self._recent_events) >= self._max_recent_events):
+                    event_time, path = heapq.heappop(heap)
+                    # 再登録されたパスは新しいエントリが残っているので削除しない
+                    if self._recent_events.get(path) == event_time:
+                        del self._recent_events[path]
                 
                 # 最近の同じファイルのイベントをチェック
-                if file_path in self._recent_events:
-                    last_event = self._recent_events[file_path]
-                    if (now - last_event).total_seconds() < self._debounce_seconds:
-                        return False  # デバウンス期間内なのでスキップ
+                last_event = self._recent_events.get(file_path)
+                if last_event is not None and now - last_event < self._debounce_seconds:
+                    return False  # デバウンス期間内なのでスキップ
                 
                 self._recent_events[file_path] = now
-                
-                # 古いエントリを清理
-                cutoff_time = now - timedelta(seconds=self._debounce_seconds * 2)
-                keys_to_remove = [
-                    key for key, timestamp in self._recent_events.items()
-                    if timestamp < cutoff_time
-                ]
-                for key in keys_to_remove:
-                    del self._recent_events[key]
+                heapq.heappush(heap, (now, file_path))
                 
                 return True
         
         def on_created(self, event):
             """ファイル作成イベント"""
-            if not self._should_process_file(event.src_path):
+            if not self._should_process_file(event):
                 return
             
             if not self._debounce_event(event.src_path):
                 return
             
-            self.logger.debug(f"ファイル作成検出: {event.src_path}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"ファイル作成検出: {event.src_path}")
             
             watch_event = WatchEvent('created', event.src_path, self.folder_pair.id)
             self.file_watcher._add_event(watch_event)
         
         def on_modified(self, event):
             """ファイル変更イベント"""
-            if not self._should_process_file(event.src_path):
+            if not self._should_process_file(event):
                 return
             
             if not self._debounce_event(event.src_path):
                 return
             
-            self.logger.debug(f"ファイル変更検出: {event.src_path}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"ファイル変更検出: {event.src_path}")
             
             watch_event = WatchEvent('modified', event.src_path, self.folder_pair.id)
             self.file_watcher._add_event(watch_event)
         
         def on_deleted(self, event):
             """ファイル削除イベント"""
-            if Path(event.src_path).is_dir():
+            if event.is_directory:
                 return
             
-            self.logger.debug(f"ファイル削除検出: {event.src_path}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"ファイル削除検出: {event.src_path}")
             
             watch_event = WatchEvent('deleted', event.src_path, self.folder_pair.id)
             self.file_watcher._add_event(watch_event)
@@ -139,11 +160,10 @@ class FileWatcher:
     """ファイル監視クラス"""
     
     def __init__(self):
-        self.logger = get_logger()
+        self.logger = _logger
         self._observers: Dict[str, Observer] = {}  # folder_pair_id -> Observer
         self._event_handlers: Dict[str, SyncEventHandler] = {}  # folder_pair_id -> Handler
-        self._event_queue: List[WatchEvent] = []
-        self._event_lock = Lock()
+        self._event_queue: queue.SimpleQueue = queue.SimpleQueue()
         self._callbacks: List[Callable[[WatchEvent], None]] = []
         self._is_running = False
         self._processor_thread: Optional[Thread] = None
@@ -218,13 +238,21 @@ class FileWatcher:
         """監視を停止"""
         self.logger.info("ファイル監視を停止します")
         
-        # イベント処理を停止
+        # イベント処理を停止（待機中のスレッドを起こすため番兵を投入）
         self._is_running = False
+        self._event_queue.put(None)
         
-        # Observerを停止
+        # Observerを停止（全てに停止要求を出してから終了を待機し、並行して停止させる）
+        stopping_observers = []
         for folder_pair_id, observer in self._observers.items():
             try:
                 observer.stop()
+                stopping_observers.append((folder_pair_id, observer))
+            except Exception as e:
+                self.logger.error(f"Observer停止エラー [{folder_pair_id}]: {e}")
+        
+        for folder_pair_id, observer in stopping_observers:
+            try:
                 observer.join(timeout=5.0)
             except Exception as e:
                 self.logger.error(f"Observer停止エラー [{folder_pair_id}]: {e}")
@@ -233,14 +261,17 @@ class FileWatcher:
         self._observers.clear()
         self._event_handlers.clear()
         
-        # イベントキューをクリア
-        with self._event_lock:
-            self._event_queue.clear()
-        
         # プロセッサスレッド終了を待機
         if self._processor_thread and self._processor_thread.is_alive():
             self._processor_thread.join(timeout=5.0)
         
+        # イベントキューをクリア
+        try:
+            while True:
+                self._event_queue.get_nowait()
+        except queue.Empty:
+            pass
+        
         self.logger.info("ファイル監視を停止しました")
     
     def is_watching(self) -> bool:
@@ -253,8 +284,7 @@ class FileWatcher:
     
     def _add_event(self, event: WatchEvent):
         """イベントをキューに追加"""
-        with self._event_lock:
-            self._event_queue.append(event)
+        self._event_queue.put(event)
     
     def _process_events(self):
         """イベント処理ループ"""
@@ -262,23 +292,22 @@ class FileWatcher:
         
         while self._is_running:
             try:
-                # イベントを取得
-                events_to_process = []
-                with self._event_lock:
-                    if self._event_queue:
-                        events_to_process = self._event_queue.copy()
-                        self._event_queue.clear()
+                # イベントを取得（到着するまで待機）
+                try:
+                    event = self._event_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
                 
-                # イベントを処理
-                for event in events_to_process:
-                    for callback in self._callbacks:
-                        try:
-                            callback(event)
-                        except Exception as e:
-                            self.logger.error(f"イベントコールバックエラー: {e}")
+                # 停止用の番兵
+                if event is None:
+                    continue
                 
-                # 少し待機
-                time.sleep(0.5)
+                # イベントを処理
+                for callback in self._callbacks:
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        self.logger.error(f"イベントコールバックエラー: {e}")
                 
             except Exception as e:
                 self.logger.error(f"イベント処理エラー: {e}")
@@ -290,7 +319,7 @@ class FileWatcher:
         """イベント統計を取得"""
         stats = {
             'watchers_count': len(self._observers),
-            'queue_size': len(self._event_queue),
+            'queue_size': self._event_queue.qsize(),
             'callbacks_count': len(self._callbacks)
         }
         return stats
\ No newline at end of file
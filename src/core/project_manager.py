@@ -2,15 +2,26 @@
 プロジェクト管理機能
 """
 
-import json
+import os
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
 
-from config.models import ProjectSettings, FolderPair, FilterRule, SyncResult, FileMappingRule, FileRenameRule
-from config.config_manager import ConfigManager
-from utils.logger import get_logger
+from ..config.models import ProjectSettings, FolderPair, FilterRule, SyncResult, FileMappingRule, FileRenameRule, to_dict, from_dict
+from ..config.config_manager import ConfigManager
+from ..utils.json_utils import json_dumps, json_loads
+from ..utils.logger import get_logger
+
+
+def _generate_ids(count: int) -> List[str]:
+    """UUID4 文字列をまとめて生成（乱数は1回の os.urandom で取得）"""
+    random_bytes = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=random_bytes[i:i + 16], version=4))
+        for i in range(0, 16 * count, 16)
+    ]
 
 
 class ProjectManager:
@@ -21,6 +32,11 @@ class ProjectManager:
         self.logger = get_logger()
         self.config_manager = config_manager or ConfigManager()
         self._current_project = None
+        self._folder_pair_index: Dict[str, FolderPair] = {}  # folder_pair_id -> FolderPair
+        
+        # deferred_save() ブロック内ではプロジェクト保存をまとめる
+        self._save_defer_depth = 0
+        self._dirty = False
     
     @property
     def current_project(self) -> Optional[ProjectSettings]:
@@ -64,13 +80,42 @@ class ProjectManager:
             return False
         
         self._current_project = project
-        self.config_manager.app_settings.current_project_id = project_id
-        self.config_manager.add_recent_project(project_id)
-        self.config_manager.save_app_settings()
+        self._rebuild_folder_pair_index()
+        with self.config_manager.deferred_save():
+            self.config_manager.app_settings.current_project_id = project_id
+            self.config_manager.add_recent_project(project_id)
+            self.config_manager.save_app_settings()
         
         self.logger.info(f"プロジェクト読み込み完了: {project.name}")
         return True
     
+    def _rebuild_folder_pair_index(self):
+        """現在のプロジェクトのフォルダペア索引を再構築"""
+        self._folder_pair_index = {}
+        if self._current_project:
+            self._folder_pair_index = {
+                folder_pair.id: folder_pair for folder_pair in self._current_project.folder_pairs
+            }
+    
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """ブロック内のフォルダペア変更による保存を終了時の1回にまとめる"""
+        self._save_defer_depth += 1
+        try:
+            with self.config_manager.deferred_save():
+                yield
+        finally:
+            self._save_defer_depth -= 1
+            if self._save_defer_depth == 0 and self._dirty:
+                self.save_current_project()
+    
+    def _mark_dirty(self):
+        """変更を保存（deferred_save() ブロック内では終了時まで保留）"""
+        if self._save_defer_depth > 0:
+            self._dirty = True
+        else:
+            self.save_current_project()
+    
     def save_current_project(self) -> bool:
         """
         現在のプロジェクトを保存
@@ -82,6 +127,7 @@ class ProjectManager:
             self.logger.warning("保存するプロジェクトがありません")
             return False
         
+        self._dirty = False
         try:
             self.config_manager.save_project(self._current_project)
             self.logger.info(f"プロジェクト保存完了: {self._current_project.name}")
@@ -107,6 +153,7 @@ class ProjectManager:
         # 現在のプロジェクトが削除された場合はクリア
         if success and self._current_project and self._current_project.id == project_id:
             self._current_project = None
+            self._folder_pair_index.clear()
             self.config_manager.app_settings.current_project_id = None
             self.config_manager.save_app_settings()
         
@@ -195,11 +242,13 @@ class ProjectManager:
         )
         
         self._current_project.folder_pairs.append(folder_pair)
-        self.save_current_project()
+        self._folder_pair_index[folder_pair.id] = folder_pair
+        self._mark_dirty()
         
         # 最近使用したフォルダに追加
-        self.config_manager.add_recent_folder(source_path)
-        self.config_manager.add_recent_folder(target_path)
+        with self.config_manager.deferred_save():
+            self.config_manager.add_recent_folder(source_path)
+            self.config_manager.add_recent_folder(target_path)
         
         self.logger.info(f"フォルダペア追加完了: {folder_pair.id}")
         return folder_pair
@@ -221,12 +270,14 @@ class ProjectManager:
         self.logger.info(f"フォルダペア削除: {folder_pair_id}")
         
         # 該当フォルダペアを検索・削除
-        for i, folder_pair in enumerate(self._current_project.folder_pairs):
-            if folder_pair.id == folder_pair_id:
-                del self._current_project.folder_pairs[i]
-                self.save_current_project()
-                self.logger.info(f"フォルダペア削除完了: {folder_pair_id}")
-                return True
+        folder_pair = self._folder_pair_index.pop(folder_pair_id, None)
+        if folder_pair:
+            self._current_project.folder_pairs = [
+                fp for fp in self._current_project.folder_pairs if fp is not folder_pair
+            ]
+            self._mark_dirty()
+            self.logger.info(f"フォルダペア削除完了: {folder_pair_id}")
+            return True
         
         self.logger.warning(f"フォルダペアが見つかりません: {folder_pair_id}")
         return False
@@ -247,15 +298,15 @@ class ProjectManager:
             return False
         
         # 該当フォルダペアを検索・更新
-        for folder_pair in self._current_project.folder_pairs:
-            if folder_pair.id == folder_pair_id:
-                for key, value in kwargs.items():
-                    if hasattr(folder_pair, key):
-                        setattr(folder_pair, key, value)
-                
-                self.save_current_project()
-                self.logger.info(f"フォルダペア更新完了: {folder_pair_id}")
-                return True
+        folder_pair = self._folder_pair_index.get(folder_pair_id)
+        if folder_pair:
+            for key, value in kwargs.items():
+                if hasattr(folder_pair, key):
+                    setattr(folder_pair, key, value)
+            
+            self._mark_dirty()
+            self.logger.info(f"フォルダペア更新完了: {folder_pair_id}")
+            return True
         
         self.logger.warning(f"フォルダペアが見つかりません: {folder_pair_id}")
         return False
@@ -273,11 +324,7 @@ class ProjectManager:
         if not self._current_project:
             return None
         
-        for folder_pair in self._current_project.folder_pairs:
-            if folder_pair.id == folder_pair_id:
-                return folder_pair
-        
-        return None
+        return self._folder_pair_index.get(folder_pair_id)
     
     def get_all_folder_pairs(self) -> List[FolderPair]:
         """
@@ -302,18 +349,47 @@ class ProjectManager:
         Returns:
             成功した場合 True
         """
-        if timestamp is None:
-            timestamp = datetime.now().isoformat()
+        return self.update_sync_timestamps({folder_pair_id: timestamp}) > 0
+    
+    def update_sync_timestamps(self, updates: Dict[str, Optional[str]]) -> int:
+        """
+        複数フォルダペアの最終同期日時をまとめて更新（保存は1回のみ）
+        
+        Args:
+            updates: フォルダペアID -> タイムスタンプ（None の場合は現在時刻）
+        
+        Returns:
+            更新したフォルダペア数
+        """
+        if not self._current_project:
+            self.logger.warning("プロジェクトが選択されていません")
+            return 0
+        
+        now = datetime.now().isoformat()
+        updated_count = 0
+        for folder_pair_id, timestamp in updates.items():
+            folder_pair = self._folder_pair_index.get(folder_pair_id)
+            if not folder_pair:
+                self.logger.warning(f"フォルダペアが見つかりません: {folder_pair_id}")
+                continue
+            
+            folder_pair.last_sync = timestamp or now
+            updated_count += 1
+        
+        if updated_count:
+            self._mark_dirty()
+            self.logger.info(f"最終同期日時更新完了: {updated_count}件")
         
-        return self.update_folder_pair(folder_pair_id, last_sync=timestamp)
+        return updated_count
     
-    def export_project(self, project_id: str, export_path: str) -> bool:
+    def export_project(self, project_id: str, export_path: str, pretty: bool = False) -> bool:
         """
         プロジェクトをエクスポート
         
         Args:
             project_id: プロジェクトID
             export_path: エクスポート先パス
+            pretty: インデント付きで出力
         
         Returns:
             成功した場合 True
@@ -324,13 +400,16 @@ class ProjectManager:
                 return False
             
             export_data = {
-                'project': project,
+                'project': to_dict(project),
                 'export_version': '1.0',
                 'exported_at': datetime.now().isoformat()
             }
             
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2, default=str)
+            # 一時ファイルに書き込んでから置き換え（書き込み途中のファイルを残さない）
+            export_file = Path(export_path)
+            tmp_file = export_file.with_name(export_file.name + '.tmp')
+            tmp_file.write_bytes(json_dumps(export_data, indent=pretty))
+            os.replace(tmp_file, export_file)
             
             self.logger.info(f"プロジェクトエクスポート完了: {export_path}")
             return True
@@ -350,21 +429,20 @@ class ProjectManager:
             インポートされたプロジェクト
         """
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                export_data = json.load(f)
+            export_data = json_loads(Path(import_path).read_bytes())
             
-            # 新しいIDを生成
+            # 新しいIDを生成（プロジェクト + フォルダペア分を一括生成）
             project_data = export_data['project']
-            project_data['id'] = str(uuid.uuid4())
-            project_data['created_at'] = datetime.now().isoformat()
-            project_data['updated_at'] = datetime.now().isoformat()
+            folder_pairs = project_data.get('folder_pairs', [])
+            new_ids = _generate_ids(1 + len(folder_pairs))
+            project_data['id'] = new_ids[0]
+            project_data['created_at'] = project_data['updated_at'] = datetime.now().isoformat()
             
             # フォルダペアのIDも再生成
-            for folder_pair in project_data.get('folder_pairs', []):
-                folder_pair['id'] = str(uuid.uuid4())
+            for folder_pair, new_id in zip(folder_pairs, new_ids[1:]):
+                folder_pair['id'] = new_id
             
             # プロジェクト保存
-            from config.models import from_dict
             project = from_dict(ProjectSettings, project_data)
             self.config_manager.save_project(project)
             
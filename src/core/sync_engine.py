@@ -2,22 +2,29 @@
 ファイル同期エンジン
 """
 
+import logging
+import os
+import threading
 import time
 from pathlib import Path
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Generator, Set, Tuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 
-from config.models import FolderPair, SyncResult, FilterRule, FileRenameRule
-from utils.logger import get_logger
-from utils.file_utils import (
-    get_file_info, is_file_newer, copy_file_with_metadata,
-    backup_file, match_patterns, scan_directory,
+from ..config.models import FolderPair, SyncResult, FilterRule
+from ..utils.logger import get_logger
+from ..utils.file_utils import (
+    FileEntry, FileFilter, get_file_info, copy_file_with_metadata,
+    backup_file, scan_directory_entries, snapshot_file_mtimes,
     format_file_size, ensure_directory
 )
 
 
+# ディレクトリを並行スキャンするスレッド数の既定値（プレビュー等、オプションがない場合にも使用）
+_SCAN_MAX_WORKERS = 8
+
+
 @dataclass
 class SyncOptions:
     """同期オプション"""
@@ -26,6 +33,13 @@ class SyncOptions:
     preserve_timestamp: bool = True  # タイムスタンプ保持
     max_workers: int = 4  # 並行処理数
     dry_run: bool = False  # ドライラン（実際にコピーしない）
+    scan_workers: int = _SCAN_MAX_WORKERS  # ディレクトリスキャンの並行数（直下のサブディレクトリ単位、1 で逐次）
+    allow_reflink: bool = False  # 同一FS上では reflink でコピー（CoW 対応FSのみ、未対応時は通常コピー）
+    allow_hardlink: bool = False  # 同一FS上ではハードリンクを作成（ターゲットの変更がソースにも反映される）
+    
+    def needs_target_state(self) -> bool:
+        """ターゲット側の既存ファイル情報が必要か（更新不要判定・バックアップ）"""
+        return not self.force_copy or (self.create_backup and not self.dry_run)
 
 
 class SyncProgressCallback:
@@ -36,7 +50,25 @@ class SyncProgressCallback:
         pass
     
     def on_file_progress(self, current: int, total: int, file_path: str, status: str):
-        """ファイル処理進捗"""
+        """ファイル処理進捗（最新の進捗のみ、最大30回/秒に間引いて通知）"""
+        pass
+    
+    def on_batch_progress(
+        self,
+        current: int,
+        total: int,
+        counts: Dict[str, int],
+        files: List[Tuple[str, str]]
+    ):
+        """
+        進捗通知ごとの集計
+        
+        Args:
+            current: 処理済みファイル数
+            total: 全ファイル数
+            counts: 前回通知以降に処理したファイルの状態別件数
+            files: 前回通知以降に処理したファイルの (相対パス, 状態)（処理順、間引きなし）
+        """
         pass
     
     def on_complete(self, result: SyncResult):
@@ -48,21 +80,64 @@ class SyncProgressCallback:
         pass
 
 
+class _ProgressThrottler:
+    """進捗通知を間引く（最大30回/秒、最後の進捗は flush() で必ず通知）"""
+    
+    def __init__(self, callback: SyncProgressCallback, interval: float = 1 / 30):
+        self._callback = callback
+        self._interval = interval
+        self._next_emit = 0.0
+        self._pending = None
+        self._counts: Dict[str, int] = {}
+        # 前回通知以降に処理したファイル（通知はまとめるが、ファイル単位の記録は落とさない）
+        self._files: List[Tuple[str, str]] = []
+    
+    def update(self, current: int, total: int, rel_path: str, status: str):
+        """進捗を記録し、前回の通知から間隔が空いていれば通知"""
+        self._counts[status] = self._counts.get(status, 0) + 1
+        self._files.append((rel_path, status))
+        
+        now = time.monotonic()
+        if now < self._next_emit:
+            self._pending = (current, total, rel_path, status)
+            return
+        
+        self._next_emit = now + self._interval
+        self._emit(current, total, rel_path, status)
+    
+    def flush(self):
+        """未通知の最新進捗を通知"""
+        if self._pending is not None:
+            self._emit(*self._pending)
+    
+    def _emit(self, current: int, total: int, rel_path: str, status: str):
+        """最新のファイル進捗と、前回通知以降に処理したファイルの一覧・状態別件数を通知"""
+        self._pending = None
+        counts, self._counts = self._counts, {}
+        files, self._files = self._files, []
+        self._callback.on_file_progress(current, total, rel_path, status)
+        self._callback.on_batch_progress(current, total, counts, files)
+
+
 class SyncEngine:
     """ファイル同期エンジン"""
     
     def __init__(self):
         self.logger = get_logger()
-        self._cancelled = False
+        self._cancel_event = threading.Event()
+        # コンパイル済みフィルタ（(含むパターン, 除外パターン) -> FileFilter）
+        self._filter_cache: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], FileFilter] = {}
+        # ファイル単位のデバッグログを出力するか（同期開始時に更新）
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
     
     def cancel(self):
         """同期をキャンセル"""
-        self._cancelled = True
+        self._cancel_event.set()
         self.logger.info("同期がキャンセルされました")
     
     def is_cancelled(self) -> bool:
         """キャンセル状態確認"""
-        return self._cancelled
+        return self._cancel_event.is_set()
     
     def sync_folder_pair(
         self,
@@ -87,8 +162,30 @@ class SyncEngine:
         if callback is None:
             callback = SyncProgressCallback()
         
-        self._cancelled = False
+        self._cancel_event.clear()
+        return self._sync_folder_pair_impl(folder_pair, options, callback)
+    
+    def _sync_folder_pair_impl(
+        self,
+        folder_pair: FolderPair,
+        options: SyncOptions,
+        callback: SyncProgressCallback,
+        sync_files: Optional[List[FileEntry]] = None
+    ) -> SyncResult:
+        """
+        フォルダペア同期の本体
+        
+        Args:
+            folder_pair: フォルダペア設定
+            options: 同期オプション
+            callback: 進捗コールバック
+            sync_files: スキャン済みの同期対象ファイル（None の場合はここでスキャン）
+        
+        Returns:
+            同期結果
+        """
         start_time = time.time()
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
         self.logger.info(f"フォルダペア同期開始: {folder_pair.name}")
         self.logger.info(f"ソース: {folder_pair.source_path}")
@@ -114,40 +211,62 @@ class SyncEngine:
                 callback.on_error(error_msg)
                 return result
             
-            # 同期対象ファイル収集
-            self.logger.info("同期対象ファイルをスキャンしています...")
-            sync_files = list(self._collect_sync_files(source_path, folder_pair.filter_rule))
+            # ターゲット側の既存ファイルを一括取得（ファイルごとの存在確認・stat を省略）
+            # ソース側のスキャンと並行して別スレッドで実行し、ディスク待ちを重ねる
+            target_future = None
+            snapshot_stop = threading.Event()
+            if options.needs_target_state():
+                snapshot_executor = ThreadPoolExecutor(max_workers=1)
+                target_future = snapshot_executor.submit(
+                    snapshot_file_mtimes, target_path, options.scan_workers, snapshot_stop
+                )
+                snapshot_executor.shutdown(wait=False)
             
-            if not sync_files:
-                self.logger.warning("同期対象ファイルが見つかりませんでした")
-                result.success = True
+            try:
+                # 同期対象ファイル収集
+                if sync_files is None:
+                    self.logger.info("同期対象ファイルをスキャンしています...")
+                    sync_files = self._collect_sync_files(
+                        source_path, folder_pair.filter_rule, options.scan_workers
+                    )
+                
+                if not sync_files:
+                    self.logger.warning("同期対象ファイルが見つかりませんでした")
+                    result.success = True
+                    result.duration_seconds = time.time() - start_time
+                    callback.on_complete(result)
+                    return result
+                
+                self.logger.info(f"同期対象ファイル数: {len(sync_files)}")
+                callback.on_start(len(sync_files))
+                
+                target_index = target_future.result() if target_future is not None else None
+                
+                # ファイル同期実行
+                if options.max_workers > 1:
+                    result = self._sync_files_parallel(
+                        sync_files, source_path, target_path, options, callback, folder_pair, target_index
+                    )
+                else:
+                    result = self._sync_files_sequential(
+                        sync_files, source_path, target_path, options, callback, folder_pair, target_index
+                    )
+                
                 result.duration_seconds = time.time() - start_time
-                callback.on_complete(result)
+                
+                if not self._cancel_event.is_set():
+                    self.logger.info(f"同期完了 - コピー: {len(result.copied_files)}, "
+                                   f"スキップ: {len(result.skipped_files)}, "
+                                   f"エラー: {len(result.error_files)}, "
+                                   f"時間: {result.duration_seconds:.2f}秒")
+                    callback.on_complete(result)
+                
                 return result
-            
-            self.logger.info(f"同期対象ファイル数: {len(sync_files)}")
-            callback.on_start(len(sync_files))
-            
-            # ファイル同期実行
-            if options.max_workers > 1:
-                result = self._sync_files_parallel(
-                    sync_files, source_path, target_path, options, callback, folder_pair
-                )
-            else:
-                result = self._sync_files_sequential(
-                    sync_files, source_path, target_path, options, callback, folder_pair
-                )
-            
-            result.duration_seconds = time.time() - start_time
-            
-            if not self._cancelled:
-                self.logger.info(f"同期完了 - コピー: {len(result.copied_files)}, "
-                               f"スキップ: {len(result.skipped_files)}, "
-                               f"エラー: {len(result.error_files)}, "
-                               f"時間: {result.duration_seconds:.2f}秒")
-                callback.on_complete(result)
-            
-            return result
+            finally:
+                # 早期リターン・例外時もターゲット側の走査を打ち切り、終了を待つ（バックグラウンドで走り続けないように）
+                if target_future is not None:
+                    snapshot_stop.set()
+                    wait([target_future])
             
         except Exception as e:
             error_msg = f"同期エラー: {e}"
@@ -156,200 +275,413 @@ class SyncEngine:
             result.duration_seconds = time.time() - start_time
             return result
     
-    def _collect_sync_files(self, source_path: Path, filter_rule: FilterRule) -> List[Path]:
-        """同期対象ファイルを収集"""
+    def _collect_sync_files(
+        self,
+        source_path: Path,
+        filter_rule: FilterRule,
+        scan_workers: int = _SCAN_MAX_WORKERS
+    ) -> List[FileEntry]:
+        """同期対象ファイルを収集（サイズ・更新日時付き）"""
         if not filter_rule.enabled:
             # フィルタ無効の場合は全ファイル
-            return list(scan_directory(source_path, [], []))
+            file_filter = self._get_file_filter((), ())
+        else:
+            file_filter = self._get_file_filter(
+                tuple(filter_rule.include_patterns),
+                tuple(filter_rule.exclude_patterns)
+            )
         
-        return list(scan_directory(
-            source_path,
-            filter_rule.include_patterns,
-            filter_rule.exclude_patterns
+        return list(scan_directory_entries(
+            source_path, file_filter=file_filter, max_workers=scan_workers
         ))
     
+    def _get_file_filter(self, include_patterns: Tuple[str, ...], exclude_patterns: Tuple[str, ...]) -> FileFilter:
+        """パターンの組み合わせごとにコンパイル済みフィルタを再利用"""
+        key = (include_patterns, exclude_patterns)
+        file_filter = self._filter_cache.get(key)
+        if file_filter is None:
+            file_filter = FileFilter(include_patterns, exclude_patterns)
+            self._filter_cache[key] = file_filter
+        return file_filter
+    
     def _sync_files_sequential(
         self,
-        files: List[Path],
+        files: List[FileEntry],
         source_base: Path,
         target_base: Path,
         options: SyncOptions,
         callback: SyncProgressCallback,
-        folder_pair: FolderPair = None
+        folder_pair: FolderPair = None,
+        target_index: Optional[Dict[str, float]] = None
     ) -> SyncResult:
         """ファイルを順次同期"""
         result = SyncResult(success=True)
+        throttler = _ProgressThrottler(callback)
+        created_dirs: Set[str] = set()  # この同期で作成済みのターゲットディレクトリ
+        rename_map = self._build_rename_map(folder_pair)
+        total = len(files)
+        target_prefix = os.path.join(str(target_base), '')
         
-        for i, source_file in enumerate(files):
-            if self._cancelled:
+        for i, entry in enumerate(files, 1):
+            if self._cancel_event.is_set():
                 break
             
+            source_file = entry.path
             try:
-                # 相対パスを計算
-                rel_path = source_file.relative_to(source_base)
-                target_file = target_base / rel_path
+                rel_path = entry.rel_path
+                target_file = target_prefix + rel_path
                 
                 # リネームルールがある場合は適用
-                if folder_pair and folder_pair.file_rename_rules:
-                    target_file = self._apply_rename_rules(
-                        source_file, target_file, folder_pair.file_rename_rules
-                    )
-                
-                callback.on_file_progress(i + 1, len(files), str(rel_path), "処理中")
+                if rename_map:
+                    target_file = self._apply_rename_rules(source_file, target_file, rename_map)
                 
-                sync_result = self._sync_single_file(source_file, target_file, options)
+                sync_result = self._sync_single_file(
+                    source_file, target_file, options, entry.mtime, target_index, created_dirs
+                )
                 
                 if sync_result == "copied":
-                    result.copied_files.append(str(rel_path))
-                    result.total_size += source_file.stat().st_size
-                    callback.on_file_progress(i + 1, len(files), str(rel_path), "コピー完了")
+                    result.copied_files.append(rel_path)
+                    result.total_size += entry.size
+                    throttler.update(i, total, rel_path, "コピー完了")
                 elif sync_result == "skipped":
-                    result.skipped_files.append(str(rel_path))
-                    callback.on_file_progress(i + 1, len(files), str(rel_path), "スキップ")
+                    result.skipped_files.append(rel_path)
+                    throttler.update(i, total, rel_path, "スキップ")
                 else:
-                    result.error_files.append(str(rel_path))
-                    callback.on_file_progress(i + 1, len(files), str(rel_path), "エラー")
+                    result.error_files.append(rel_path)
+                    throttler.update(i, total, rel_path, "エラー")
                     
             except Exception as e:
-                self.logger.error(f"ファイル同期エラー {source_file}: {e}")
-                result.error_files.append(str(source_file))
+                self.logger.error("ファイル同期エラー %s: %s", source_file, e)
+                result.error_files.append(source_file)
         
+        throttler.flush()
         return result
     
     def _sync_files_parallel(
         self,
-        files: List[Path],
+        files: List[FileEntry],
         source_base: Path,
         target_base: Path,
         options: SyncOptions,
         callback: SyncProgressCallback,
-        folder_pair: FolderPair = None
+        folder_pair: FolderPair = None,
+        target_index: Optional[Dict[str, float]] = None
     ) -> SyncResult:
-        """ファイルを並行同期"""
+        """ファイルを並行同期（ファイルをバッチにまとめてワーカーへ渡す）"""
         result = SyncResult(success=True)
+        throttler = _ProgressThrottler(callback)
         completed_count = 0
+        created_dirs: Set[str] = set()  # この同期で作成済みのターゲットディレクトリ
+        
+        # 同期タスク作成（ソース情報, ターゲットパス）
+        rename_map = self._build_rename_map(folder_pair)
+        total = len(files)
+        target_prefix = os.path.join(str(target_base), '')
+        tasks = []
+        for entry in files:
+            target_file = target_prefix + entry.rel_path
+            
+            # リネームルールがある場合は適用
+            if rename_map:
+                target_file = self._apply_rename_rules(entry.path, target_file, rename_map)
+            
+            tasks.append((entry, target_file))
+        
+        # ワーカーあたり約4バッチに分割（1ファイル1タスクのスケジューリング負荷を削減）
+        chunk_size = max(1, len(tasks) // (options.max_workers * 4))
         
         with ThreadPoolExecutor(max_workers=options.max_workers) as executor:
             # タスク提出
-            future_to_file = {}
-            for source_file in files:
-                if self._cancelled:
+            futures = []
+            for i in range(0, len(tasks), chunk_size):
+                if self._cancel_event.is_set():
                     break
-                
-                rel_path = source_file.relative_to(source_base)
-                target_file = target_base / rel_path
-                
-                # リネームルールがある場合は適用
-                if folder_pair and folder_pair.file_rename_rules:
-                    target_file = self._apply_rename_rules(
-                        source_file, target_file, folder_pair.file_rename_rules
-                    )
-                
-                future = executor.submit(self._sync_single_file, source_file, target_file, options)
-                future_to_file[future] = (source_file, rel_path)
+                futures.append(executor.submit(
+                    self._sync_batch, tasks[i:i + chunk_size], options, target_index, created_dirs
+                ))
             
             # 結果収集
-            for future in as_completed(future_to_file.keys()):
-                if self._cancelled:
+            for future in as_completed(futures):
+                if self._cancel_event.is_set():
+                    # 未開始のバッチは実行しない
+                    for pending in futures:
+                        pending.cancel()
                     break
                 
-                source_file, rel_path = future_to_file[future]
-                completed_count += 1
-                
                 try:
-                    sync_result = future.result()
+                    batch_results = future.result()
+                except Exception as e:
+                    self.logger.error(f"並行同期エラー: {e}")
+                    continue
+                
+                for entry, sync_result in batch_results:
+                    completed_count += 1
+                    rel_path = entry.rel_path
                     
                     if sync_result == "copied":
-                        result.copied_files.append(str(rel_path))
-                        result.total_size += source_file.stat().st_size
-                        callback.on_file_progress(completed_count, len(files), str(rel_path), "コピー完了")
+                        result.copied_files.append(rel_path)
+                        result.total_size += entry.size
+                        throttler.update(completed_count, total, rel_path, "コピー完了")
                     elif sync_result == "skipped":
-                        result.skipped_files.append(str(rel_path))
-                        callback.on_file_progress(completed_count, len(files), str(rel_path), "スキップ")
+                        result.skipped_files.append(rel_path)
+                        throttler.update(completed_count, total, rel_path, "スキップ")
                     else:
-                        result.error_files.append(str(rel_path))
-                        callback.on_file_progress(completed_count, len(files), str(rel_path), "エラー")
-                        
-                except Exception as e:
-                    self.logger.error(f"並行同期エラー {source_file}: {e}")
-                    result.error_files.append(str(rel_path))
-                    callback.on_file_progress(completed_count, len(files), str(rel_path), "エラー")
+                        result.error_files.append(rel_path)
+                        throttler.update(completed_count, total, rel_path, "エラー")
         
+        throttler.flush()
         return result
     
+    def _sync_batch(
+        self,
+        tasks: List[Tuple[FileEntry, str]],
+        options: SyncOptions,
+        target_index: Optional[Dict[str, float]] = None,
+        created_dirs: Optional[Set[str]] = None
+    ) -> List[Tuple[FileEntry, str]]:
+        """
+        バッチ内のファイルを順次同期（ワーカースレッドで実行）
+        
+        Args:
+            tasks: (ソース情報, ターゲットパス) のリスト
+            options: 同期オプション
+            target_index: ターゲット側ファイルの更新日時スナップショット
+            created_dirs: この同期で作成済みのターゲットディレクトリ（ワーカー間で共有）
+        
+        Returns:
+            (ソース情報, 同期結果) のリスト
+        """
+        results = []
+        for entry, target_file in tasks:
+            if self._cancel_event.is_set():
+                break
+            
+            sync_result = self._sync_single_file(
+                entry.path, target_file, options, entry.mtime, target_index, created_dirs
+            )
+            results.append((entry, sync_result))
+        
+        return results
+    
+    @staticmethod
+    def _build_rename_map(folder_pair: Optional[FolderPair]) -> Dict[str, str]:
+        """
+        有効なリネームルールをファイル名の辞書に変換（同じファイル名は先のルールを優先）
+        
+        Args:
+            folder_pair: フォルダペア設定
+        
+        Returns:
+            ソースファイル名 -> ターゲットファイル名
+        """
+        rename_map = {}
+        if folder_pair:
+            for rule in folder_pair.file_rename_rules:
+                if rule.enabled:
+                    rename_map.setdefault(rule.source_filename, rule.target_filename)
+        return rename_map
+    
     def _apply_rename_rules(
         self, 
-        source_file: Path, 
-        target_file: Path, 
-        rename_rules: List[FileRenameRule]
-    ) -> Path:
+        source_file: str, 
+        target_file: str, 
+        rename_map: Dict[str, str]
+    ) -> str:
         """
         リネームルールを適用してターゲットファイルパスを更新
         
         Args:
             source_file: ソースファイルパス
             target_file: 元のターゲットファイルパス
-            rename_rules: リネームルールリスト
+            rename_map: ソースファイル名 -> ターゲットファイル名（_build_rename_map で作成）
         
         Returns:
             更新されたターゲットファイルパス
         """
-        source_filename = source_file.name
+        # 完全一致でファイル名をチェック
+        new_name = rename_map.get(os.path.basename(source_file))
+        if new_name is None:
+            # マッチするルールがない場合は元のパスを返す
+            return target_file
         
-        for rule in rename_rules:
-            if not rule.enabled:
-                continue
-            
-            # 完全一致でファイル名をチェック
-            if source_filename == rule.source_filename:
-                # ターゲットファイル名を変更
-                new_target = target_file.parent / rule.target_filename
-                self.logger.debug(f"リネームルール適用: {source_filename} -> {rule.target_filename}")
-                return new_target
-        
-        # マッチするルールがない場合は元のパスを返す
-        return target_file
+        # ターゲットファイル名を変更
+        return os.path.join(os.path.dirname(target_file), new_name)
     
-    def _sync_single_file(self, source_file: Path, target_file: Path, options: SyncOptions) -> str:
+    def _sync_single_file(
+        self,
+        source_file: str,
+        target_file: str,
+        options: SyncOptions,
+        source_mtime: Optional[float] = None,
+        target_index: Optional[Dict[str, float]] = None,
+        created_dirs: Optional[Set[str]] = None
+    ) -> str:
         """
         単一ファイル同期
         
+        Args:
+            source_file: ソースファイルパス
+            target_file: ターゲットファイルパス
+            options: 同期オプション
+            source_mtime: スキャン時に取得したソース更新日時（指定時はソースを再 stat しない）
+            target_index: ターゲット側ファイルの更新日時スナップショット（指定時はターゲットを stat しない）
+            created_dirs: この同期で作成済みのターゲットディレクトリ（ファイルごとの mkdir を省略）
+        
         Returns:
             "copied", "skipped", "error"
         """
         try:
+            target_key = None
+            target_mtime = None
+            if options.needs_target_state():
+                if target_index is not None:
+                    target_key = os.path.normcase(target_file)
+                    target_mtime = target_index.get(target_key)
+                else:
+                    target_mtime = self._get_target_mtime(target_file, None)
+            
+            if source_mtime is None:
+                source_mtime = os.stat(source_file).st_mtime
+            
+            # コピー必要性チェック（変更のないファイルはドライラン・バックアップより前にスキップ）
+            if not options.force_copy and target_mtime is not None and source_mtime <= target_mtime:
+                if self._debug_enabled:
+                    self.logger.debug("スキップ（更新不要）: %s", source_file)
+                return "skipped"
+            
             # ドライラン
             if options.dry_run:
-                self.logger.debug(f"[DRY RUN] {source_file} -> {target_file}")
+                if self._debug_enabled:
+                    self.logger.debug("[DRY RUN] %s -> %s", source_file, target_file)
                 return "copied"
             
-            # コピー必要性チェック
-            if not options.force_copy and target_file.exists():
-                if not is_file_newer(source_file, target_file):
-                    self.logger.debug(f"スキップ（更新不要）: {source_file}")
-                    return "skipped"
-            
-            # バックアップ作成
-            if options.create_backup and target_file.exists():
-                backup_path = backup_file(target_file)
-                if backup_path:
-                    self.logger.debug(f"バックアップ作成: {backup_path}")
+            # バックアップ作成（コピーはターゲットを別 inode に置き換えるため、ハードリンクで退避できる。
+            # ハードリンク同期ではターゲットがソースと同じ実体のため、内容をコピーして退避）
+            if options.create_backup and target_mtime is not None:
+                backup_path = backup_file(Path(target_file), allow_hardlink=not options.allow_hardlink)
+                if backup_path and self._debug_enabled:
+                    self.logger.debug("バックアップ作成: %s", backup_path)
             
             # ファイルコピー
-            if copy_file_with_metadata(source_file, target_file, options.preserve_timestamp):
-                self.logger.debug(f"コピー完了: {source_file} -> {target_file}")
+            if copy_file_with_metadata(
+                Path(source_file), Path(target_file), options.preserve_timestamp,
+                options.allow_reflink, options.allow_hardlink, created_dirs
+            ):
+                if self._debug_enabled:
+                    self.logger.debug("コピー完了: %s -> %s", source_file, target_file)
+                if target_key is not None:
+                    # スナップショットを書き込み後の状態に更新（copystat で更新日時はソースと同じ）
+                    target_index[target_key] = source_mtime
                 return "copied"
             else:
-                self.logger.error(f"コピー失敗: {source_file}")
+                self.logger.error("コピー失敗: %s", source_file)
                 return "error"
                 
         except Exception as e:
-            self.logger.error(f"ファイル同期エラー {source_file}: {e}")
+            self.logger.error("ファイル同期エラー %s: %s", source_file, e)
             return "error"
     
+    @staticmethod
+    def _get_target_mtime(target_file: str, target_index: Optional[Dict[str, float]]) -> Optional[float]:
+        """ターゲットファイルの更新日時を取得（存在しない場合は None）"""
+        if target_index is not None:
+            return target_index.get(os.path.normcase(target_file))
+        
+        try:
+            return os.stat(target_file).st_mtime
+        except OSError:
+            return None
+    
+    def _classify_sync_files(
+        self,
+        folder_pair: FolderPair
+    ) -> Generator[Tuple[FileEntry, bool, bool], None, None]:
+        """
+        同期対象ファイルごとにコピー要否を判定（ソースのスキャン結果とターゲットのスナップショットを使用）
+        
+        Yields:
+            (ソース情報, ターゲット存在有無, コピー要否)
+        """
+        source_path = Path(folder_pair.source_path)
+        target_path = Path(folder_pair.target_path)
+        
+        sync_files = self._collect_sync_files(source_path, folder_pair.filter_rule)
+        target_index = snapshot_file_mtimes(target_path, _SCAN_MAX_WORKERS)
+        
+        target_prefix = os.path.join(str(target_path), '')
+        for entry in sync_files:
+            target_mtime = target_index.get(os.path.normcase(target_prefix + entry.rel_path))
+            target_exists = target_mtime is not None
+            needs_copy = not target_exists or entry.mtime > target_mtime
+            yield entry, target_exists, needs_copy
+    
+    def get_sync_summary(self, folder_pair: FolderPair) -> Dict[str, Any]:
+        """
+        同期プレビューの集計のみを取得（ファイルごとの情報は作成しない）
+        
+        Args:
+            folder_pair: フォルダペア設定
+        
+        Returns:
+            件数・合計サイズの辞書
+        """
+        if not Path(folder_pair.source_path).exists():
+            return {"error": "ソースフォルダが存在しません"}
+        
+        try:
+            copy_count = 0
+            skip_count = 0
+            total_size = 0
+            
+            for entry, _, needs_copy in self._classify_sync_files(folder_pair):
+                if needs_copy:
+                    copy_count += 1
+                    total_size += entry.size
+                else:
+                    skip_count += 1
+            
+            return {
+                "copy_count": copy_count,
+                "skip_count": skip_count,
+                "total_size": total_size,
+                "total_size_formatted": format_file_size(total_size)
+            }
+            
+        except Exception as e:
+            return {"error": f"プレビュー取得エラー: {e}"}
+    
+    def iter_sync_preview(
+        self,
+        folder_pair: FolderPair,
+        max_items: Optional[int] = 1000
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        同期プレビューのファイル情報を順次取得
+        
+        Args:
+            folder_pair: フォルダペア設定
+            max_items: 最大件数（None の場合は全件）
+        
+        Yields:
+            ファイル情報辞書（relative_path, target_exists, will_copy 付き。
+            modified/created は UNIX 時刻のため、表示時に format_file_info_for_display で変換）
+        """
+        if not Path(folder_pair.source_path).exists():
+            return
+        
+        for i, (entry, target_exists, needs_copy) in enumerate(self._classify_sync_files(folder_pair)):
+            if max_items is not None and i >= max_items:
+                break
+            
+            file_info = get_file_info(Path(entry.path), convert_times=False)
+            file_info['relative_path'] = entry.rel_path
+            file_info['target_exists'] = target_exists
+            file_info['will_copy'] = needs_copy
+            yield file_info
+    
     def get_sync_preview(self, folder_pair: FolderPair) -> Dict[str, Any]:
         """
-        同期プレビューを取得
+        同期プレビューを取得（全ファイルの情報を含む。集計のみの場合は get_sync_summary を使用）
         
         Args:
             folder_pair: フォルダペア設定
@@ -357,34 +689,21 @@ class SyncEngine:
         Returns:
             プレビュー情報辞書
         """
-        source_path = Path(folder_pair.source_path)
-        target_path = Path(folder_pair.target_path)
-        
-        if not source_path.exists():
+        if not Path(folder_pair.source_path).exists():
             return {"error": "ソースフォルダが存在しません"}
         
         try:
-            # 同期対象ファイル収集
-            sync_files = list(self._collect_sync_files(source_path, folder_pair.filter_rule))
-            
             # 分析
             files_to_copy = []
             files_to_skip = []
             total_size = 0
             
-            for source_file in sync_files:
-                rel_path = source_file.relative_to(source_path)
-                target_file = target_path / rel_path
-                
-                file_info = get_file_info(source_file)
-                file_info['relative_path'] = str(rel_path)
-                file_info['target_exists'] = target_file.exists()
-                
-                if target_file.exists() and not is_file_newer(source_file, target_file):
-                    files_to_skip.append(file_info)
-                else:
+            for file_info in self.iter_sync_preview(folder_pair, max_items=None):
+                if file_info['will_copy']:
                     files_to_copy.append(file_info)
                     total_size += file_info['size']
+                else:
+                    files_to_skip.append(file_info)
             
             return {
                 "files_to_copy": files_to_copy,
@@ -421,7 +740,7 @@ class SyncEngine:
         if callback is None:
             callback = SyncProgressCallback()
         
-        self._cancelled = False
+        self._cancel_event.clear()
         start_time = time.time()
         
         self.logger.info(f"複数フォルダペア同期開始: {len(folder_pairs)}個")
@@ -434,14 +753,18 @@ class SyncEngine:
         error_files = 0
         
         try:
-            # 全フォルダペアのファイル数を事前計算
+            # 全フォルダペアのファイル数を事前計算（スキャン結果は同期時に再利用）
+            scanned_files: Dict[int, List[FileEntry]] = {}
             for folder_pair in folder_pairs:
                 if not folder_pair.enabled:
                     continue
                 
                 source_path = Path(folder_pair.source_path)
                 if source_path.exists():
-                    sync_files = list(self._collect_sync_files(source_path, folder_pair.filter_rule))
+                    sync_files = self._collect_sync_files(
+                        source_path, folder_pair.filter_rule, options.scan_workers
+                    )
+                    scanned_files[id(folder_pair)] = sync_files
                     total_files += len(sync_files)
             
             if total_files == 0:
@@ -455,7 +778,7 @@ class SyncEngine:
             
             # 各フォルダペアを順次処理
             for folder_pair in folder_pairs:
-                if self._cancelled:
+                if self._cancel_event.is_set():
                     break
                 
                 if not folder_pair.enabled:
@@ -465,7 +788,9 @@ class SyncEngine:
                 self.logger.info(f"フォルダペア処理開始: {folder_pair.name}")
                 
                 # 単一フォルダペア同期
-                single_result = self.sync_folder_pair(folder_pair, options, callback)
+                single_result = self._sync_folder_pair_impl(
+                    folder_pair, options, callback, scanned_files.get(id(folder_pair))
+                )
                 
                 if single_result.success:
                     copied_files += len(single_result.copied_files)
@@ -476,13 +801,13 @@ class SyncEngine:
                 
                 processed_files += len(single_result.copied_files) + len(single_result.skipped_files) + len(single_result.error_files)
             
-            result.success = not self._cancelled and error_files == 0
+            result.success = not self._cancel_event.is_set() and error_files == 0
             result.copied_files = [f"複数同期: {copied_files}ファイル"]
             result.skipped_files = [f"複数同期: {skipped_files}ファイル"]
             result.error_files = [f"複数同期: {error_files}ファイル"] if error_files > 0 else []
             result.duration_seconds = time.time() - start_time
             
-            if not self._cancelled:
+            if not self._cancel_event.is_set():
                 self.logger.info(f"複数同期完了: コピー={copied_files}, スキップ={skipped_files}, エラー={error_files}")
                 callback.on_complete(result)
             else:
@@ -3,10 +3,10 @@
 """
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QListWidget,
+    QDialog, QVBoxLayout, QHBoxLayout, QListView,
     QPushButton, QInputDialog, QMessageBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QStringListModel
 
 
 class CategoryDialog(QDialog):
@@ -15,6 +15,8 @@ class CategoryDialog(QDialog):
     def __init__(self, categories, parent=None):
         super().__init__(parent)
         self.categories = categories.copy()
+        # 重複チェック用（categories と常に同じ内容を保持）
+        self._category_set = set(self.categories)
         self.init_ui()
 
     def init_ui(self):
@@ -25,9 +27,11 @@ class CategoryDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        # カテゴリリスト
-        self.category_list = QListWidget()
-        self.category_list.addItems(self.categories)
+        # カテゴリリスト（モデルに一括設定し、項目ごとのウィジェット生成を避ける）
+        self.category_model = QStringListModel(self.categories, self)
+        self.category_list = QListView()
+        self.category_list.setModel(self.category_model)
+        self.category_list.setEditTriggers(QListView.NoEditTriggers)
         layout.addWidget(self.category_list)
 
         # ボタンレイアウト
@@ -63,22 +67,30 @@ class CategoryDialog(QDialog):
     def add_category(self):
         """カテゴリ追加"""
         text, ok = QInputDialog.getText(self, "カテゴリ追加", "新しいカテゴリ名:")
-        if ok and text.strip():
-            if text.strip() not in self.categories:
-                self.categories.append(text.strip())
-                self.category_list.addItem(text.strip())
+        text = text.strip()
+        if ok and text:
+            if text not in self._category_set:
+                self.categories.append(text)
+                self._category_set.add(text)
+                row = self.category_model.rowCount()
+                self.category_model.insertRows(row, 1)
+                self.category_model.setData(self.category_model.index(row), text)
             else:
                 QMessageBox.warning(self, "警告", "同じ名前のカテゴリが既に存在します。")
 
     def remove_category(self):
         """カテゴリ削除"""
-        item = self.category_list.currentItem()
-        if item:
-            if item.text() == "未分類":
+        index = self.category_list.currentIndex()
+        if index.isValid():
+            row = index.row()
+            text = self.categories[row]
+            if text == "未分類":
                 QMessageBox.warning(self, "警告", "「未分類」は削除できません。")
             else:
-                self.categories.remove(item.text())
-                self.category_list.takeItem(self.category_list.row(item))
+                # 行番号で削除（名前での線形検索は不要）
+                del self.categories[row]
+                self._category_set.discard(text)
+                self.category_model.removeRow(row)
 
     def get_categories(self):
         """カテゴリリストを取得"""
@@ -2,14 +2,22 @@
 ドラッグ&ドロップ対応ツリーウィジェット
 """
 
-from pathlib import Path
-from typing import List, Callable
+import os
+import stat
+from functools import lru_cache
+from typing import List, Callable, Set
 
 from PySide6.QtWidgets import QTreeWidget, QMessageBox
 from PySide6.QtCore import Qt, QUrl
 from PySide6.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent
 
 
+@lru_cache(maxsize=1024)
+def _resolve_path(path_str: str) -> str:
+    """パスを正規化（シンボリックリンク解決の結果をキャッシュ）"""
+    return os.path.realpath(path_str)
+
+
 class DragDropTreeWidget(QTreeWidget):
     """ドラッグ&ドロップ対応ツリーウィジェット"""
     
@@ -48,22 +56,31 @@ class DragDropTreeWidget(QTreeWidget):
             event.ignore()
             return
         
-        # ドロップされたURLを取得
+        # ドロップされたURLを取得（重複は set で除外し、stat は1パスにつき1回）
         urls = event.mimeData().urls()
         folder_paths = []
+        seen: Set[str] = set()
         
         for url in urls:
-            if url.isLocalFile():
-                file_path = Path(url.toLocalFile())
-                if file_path.exists():
-                    if file_path.is_dir():
-                        # フォルダの場合
-                        folder_paths.append(str(file_path))
-                    else:
-                        # ファイルの場合は親フォルダを追加
-                        parent_folder = file_path.parent
-                        if str(parent_folder) not in folder_paths:
-                            folder_paths.append(str(parent_folder))
+            if not url.isLocalFile():
+                continue
+            
+            file_path = os.path.normpath(url.toLocalFile())
+            try:
+                mode = os.stat(file_path).st_mode
+            except OSError:
+                continue
+            
+            if stat.S_ISDIR(mode):
+                # フォルダの場合
+                folder = file_path
+            else:
+                # ファイルの場合は親フォルダを追加
+                folder = os.path.dirname(file_path)
+            
+            if folder not in seen:
+                seen.add(folder)
+                folder_paths.append(folder)
         
         if folder_paths and self.drop_callback:
             self.drop_callback(folder_paths)
@@ -76,10 +93,11 @@ class DragDropTreeWidget(QTreeWidget):
         
         for path_str in paths:
             try:
-                path = Path(path_str).resolve()
-                if path.exists() and path.is_dir():
-                    valid_folders.append(str(path))
-            except Exception:
+                # 解決済みパスはキャッシュし、存在確認は毎回 stat 1回で行う
+                path = _resolve_path(path_str)
+                if stat.S_ISDIR(os.stat(path).st_mode):
+                    valid_folders.append(path)
+            except (OSError, ValueError):
                 continue
         
         return valid_folders
\ No newline at end of file
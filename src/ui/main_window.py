@@ -2,97 +2,194 @@
 メインウィンドウ
 """
 
+import os
+import stat
 import sys
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Deque, Dict, Optional, List, Tuple
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QTableWidget, QTableWidgetItem,
+    QTreeWidget, QTreeWidgetItem, QTableView,
     QTabWidget, QPushButton, QLabel, QComboBox, QProgressBar,
-    QTextEdit, QMenuBar, QMenu, QStatusBar, QMessageBox,
+    QPlainTextEdit, QMenuBar, QMenu, QStatusBar, QMessageBox,
     QFileDialog, QGroupBox, QCheckBox, QSpinBox, QFormLayout,
-    QLineEdit
+    QLineEdit, QHeaderView
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QThread, QThreadPool, QRunnable, QEventLoop, Signal, Slot, QSize, QObject, QUrl
 )
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QSize, QDateTime, QObject, QUrl
 from PySide6.QtGui import QAction, QIcon, QFont, QDesktopServices
 
-from core.project_manager import ProjectManager
-from core.sync_engine import SyncEngine, SyncOptions, SyncProgressCallback
-from core.file_watcher import FileWatcher, WatchEvent
-from config.config_manager import ConfigManager
-from utils.logger import get_logger, init_global_logger
-from ui.project_dialog import ProjectDialog
-from ui.sync_dialog import SyncDialog
-from ui.drag_drop_tree import DragDropTreeWidget
+from ..core.project_manager import ProjectManager
+from ..core.sync_engine import SyncEngine, SyncOptions, SyncProgressCallback
+from ..core.file_watcher import FileWatcher, WatchEvent
+from ..config.config_manager import ConfigManager
+from ..utils.logger import get_logger, init_global_logger
+from .project_dialog import ProjectDialog
+from .sync_dialog import SyncDialog
+from .drag_drop_tree import DragDropTreeWidget
+from .sync_result_model import SyncResultModel
+
+
+def _folder_name(folder_path: str) -> str:
+    """パス末尾のフォルダ名（末尾の区切り文字は無視）"""
+    return os.path.basename(os.path.normpath(folder_path))
+
+
+# 最近開いたフォルダのメニュー表示：これより長いパスは短縮し、末尾をこの文字数だけ表示
+_RECENT_FOLDER_MAX_LENGTH = 50
+_RECENT_FOLDER_TAIL_LENGTH = 30
+
+
+@lru_cache(maxsize=64)
+def _recent_folder_display_text(folder_path: str) -> str:
+    """最近開いたフォルダのメニュー表示名（パスが長い場合はフォルダ名＋末尾に短縮）"""
+    if len(folder_path) > _RECENT_FOLDER_MAX_LENGTH:
+        return f"{_folder_name(folder_path)} (...{folder_path[-_RECENT_FOLDER_TAIL_LENGTH:]})"
+    return folder_path
+
+
+class _PathExistsCache:
+    """メニュー表示用の存在確認キャッシュ（短時間だけ結果を保持し、低速なドライブへの stat を減らす）"""
+    
+    def __init__(self, ttl: float = 2.0):
+        self._entries: Dict[str, Tuple[float, bool]] = {}
+        self._ttl = ttl
+    
+    def exists(self, path: str) -> bool:
+        """パスが存在するか（TTL 内はキャッシュを返す）"""
+        now = time.monotonic()
+        entry = self._entries.get(path)
+        if entry and now - entry[0] < self._ttl:
+            return entry[1]
+        
+        result = os.path.exists(path)
+        self._entries[path] = (now, result)
+        return result
+    
+    def clear(self):
+        """キャッシュを破棄"""
+        self._entries.clear()
+
+
+class _FolderExistsSignals(QObject):
+    """フォルダ存在確認の結果通知"""
+    
+    finished = Signal(object)  # Dict[str, bool]
+
+
+class _FolderExistsChecker(QRunnable):
+    """フォルダの存在確認をスレッドプールで実行（切断されたドライブで UI を止めない）"""
+    
+    def __init__(self, folder_paths: List[str], signals: _FolderExistsSignals):
+        super().__init__()
+        self.folder_paths = folder_paths
+        self.signals = signals
+    
+    def run(self):
+        self.signals.finished.emit({path: os.path.exists(path) for path in self.folder_paths})
+
+
+def _resolve_open_target(folder_path: str) -> Tuple[str, Optional[bool], Optional[str]]:
+    """
+    開くパスを解決して種別を判定
+    
+    Returns:
+        (解決済みパス, フォルダなら True・ファイルなら False・存在しなければ None, エラーメッセージ)
+    """
+    try:
+        resolved = str(Path(folder_path).resolve())
+        try:
+            mode = os.stat(resolved).st_mode
+        except FileNotFoundError:
+            return resolved, None, None
+        return resolved, stat.S_ISDIR(mode), None
+    except Exception as e:
+        return folder_path, None, str(e)
+
+
+class _ResolvePathSignals(QObject):
+    """パス解決結果の通知"""
+    
+    finished = Signal(object)  # _resolve_open_target の戻り値
 
 
-class SyncThread(QThread):
-    """同期処理スレッド"""
+class _ResolvePathTask(QRunnable):
+    """パス解決をスレッドプールで実行（ネットワークパスで UI を止めない）"""
+    
+    def __init__(self, folder_path: str, signals: _ResolvePathSignals):
+        super().__init__()
+        self.folder_path = folder_path
+        self.signals = signals
+    
+    def run(self):
+        self.signals.finished.emit(_resolve_open_target(self.folder_path))
+
+
+class SyncWorker(QObject):
+    """同期処理ワーカー（常駐スレッドに移して使い回す）"""
     
-    progress = Signal(int, int, str, str)  # current, total, file_path, status
     finished = Signal(object)  # SyncResult
     error = Signal(str)
+    done = Signal()  # 成否に関わらず処理終了時に通知
     
-    def __init__(self, sync_engine, folder_pair, options):
+    def __init__(self, sync_engine, progress_queue):
         super().__init__()
         self.sync_engine = sync_engine
-        self.folder_pair = folder_pair
-        self.options = options
+        self.progress_queue = progress_queue  # 進捗 (current, total, file_path, status) の受け渡し先
     
-    def run(self):
+    @Slot(object, object)
+    def sync_one(self, folder_pair, options):
         """同期実行"""
         try:
-            callback = SyncCallback()
-            callback.progress.connect(self.progress.emit)
+            callback = SyncCallback(self.progress_queue)
             callback.error.connect(self.error.emit)
             
-            result = self.sync_engine.sync_folder_pair(
-                self.folder_pair, self.options, callback
-            )
+            result = self.sync_engine.sync_folder_pair(folder_pair, options, callback)
             self.finished.emit(result)
             
         except Exception as e:
             self.error.emit(f"同期エラー: {e}")
-
-
-class MultipleSyncThread(QThread):
-    """複数フォルダペア同期処理スレッド"""
-    
-    progress = Signal(int, int, str, str)  # current, total, file_path, status
-    finished = Signal(object)  # SyncResult
-    error = Signal(str)
+        finally:
+            self.done.emit()
     
-    def __init__(self, sync_engine, folder_pairs, options):
-        super().__init__()
-        self.sync_engine = sync_engine
-        self.folder_pairs = folder_pairs
-        self.options = options
-    
-    def run(self):
+    @Slot(object, object)
+    def sync_many(self, folder_pairs, options):
         """複数同期実行"""
         try:
-            callback = SyncCallback()
-            callback.progress.connect(self.progress.emit)
+            callback = SyncCallback(self.progress_queue)
             callback.error.connect(self.error.emit)
             
-            result = self.sync_engine.sync_multiple_folder_pairs(
-                self.folder_pairs, self.options, callback
-            )
+            result = self.sync_engine.sync_multiple_folder_pairs(folder_pairs, options, callback)
             self.finished.emit(result)
             
         except Exception as e:
             self.error.emit(f"複数同期エラー: {e}")
+        finally:
+            self.done.emit()
 
 
 class SyncCallback(QObject, SyncProgressCallback):
     """同期進捗コールバック（Qt版）"""
     
-    progress = Signal(int, int, str, str)
     error = Signal(str)
     
-    def on_file_progress(self, current, total, file_path, status):
-        self.progress.emit(current, total, file_path, status)
+    def __init__(self, progress_queue: Deque[Tuple[int, int, str, str]]):
+        super().__init__()
+        self.progress_queue = progress_queue
+    
+    def on_batch_progress(self, current, total, counts, files):
+        # スレッド間のシグナル送信は行わず、キューに積んで GUI 側のタイマーで取り出す
+        # 間引かれた on_file_progress ではなく、ファイルごとの記録から結果テーブルの行を作る
+        start = current - len(files)
+        self.progress_queue.extend(
+            (start + i, total, file_path, status)
+            for i, (file_path, status) in enumerate(files, 1)
+        )
     
     def on_error(self, error):
         self.error.emit(error)
@@ -101,6 +198,10 @@ class SyncCallback(QObject, SyncProgressCallback):
 class MainWindow(QMainWindow):
     """メインウィンドウ"""
     
+    # 同期ワーカーへの処理依頼（スレッドを跨ぐため QueuedConnection で届く）
+    _request_sync_one = Signal(object, object)  # folder_pair, options
+    _request_sync_many = Signal(object, object)  # folder_pairs, options
+    
     def __init__(self):
         super().__init__()
         
@@ -114,13 +215,66 @@ class MainWindow(QMainWindow):
         self.file_watcher = FileWatcher()
         
         # UI初期化
-        self.sync_thread = None
+        self._sync_running = False
+        self._shutdown_loop: Optional[QEventLoop] = None  # 終了時に同期の停止を待つイベントループ
+        self._close_pending = False  # 同期スレッドの停止待ちで終了を見送った（同期終了時に閉じ直す）
+        self._cached_options: Optional[SyncOptions] = None
+        
+        # 同期進捗はまとめて反映（ファイルごとの行追加・再描画を避ける）
+        # 同期スレッドが追加し、GUI スレッドのタイマーが取り出す（deque の append/popleft はスレッドセーフ）
+        self._pending_progress: Deque[Tuple[int, int, str, str]] = deque()
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setInterval(50)
+        self._ui_flush_timer.timeout.connect(self._flush_sync_progress)
+        self._last_progress_pct = -1
+        
+        # ログメッセージはまとめて追加（1行ごとのレイアウト更新を避ける）
+        self._pending_log: Deque[str] = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log_messages)
+        
+        # ファイル監視イベントはまとめて処理（監視スレッドが追加し、GUI スレッドのタイマーが取り出す）
+        self._pending_file_events: Deque[WatchEvent] = deque(maxlen=10000)
+        self._file_event_timer = QTimer(self)
+        self._file_event_timer.setInterval(100)
+        self._file_event_timer.timeout.connect(self._flush_file_events)
+        
+        # コンテキストメニュー等の存在確認キャッシュ（メニューの操作時に改めて確認される）
+        self._exists_cache = _PathExistsCache()
+        
+        # 最近開いたフォルダの存在確認結果（バックグラウンドで更新し、メニューはこれを参照）
+        self._recent_exists: Dict[str, bool] = {}
+        self._recent_menu_key: Optional[Tuple[Tuple[str, bool], ...]] = None
+        self._recent_exists_signals = _FolderExistsSignals(self)
+        self._recent_exists_signals.finished.connect(self._on_recent_exists_checked)
+        
+        # ネットワークパスを開く際のパス解決結果
+        self._open_folder_signals = _ResolvePathSignals(self)
+        self._open_folder_signals.finished.connect(self._open_resolved_folder)
+        
+        # フォルダペアツリーの項目（folder_pair.id -> QTreeWidgetItem）
+        self._tree_items: Dict[str, QTreeWidgetItem] = {}
+        
+        # 同期ワーカー（スレッドは起動したまま同期ごとに使い回す）
+        self._sync_worker = SyncWorker(self.sync_engine, self._pending_progress)
+        self._worker_thread = QThread(self)
+        self._sync_worker.moveToThread(self._worker_thread)
+        self._request_sync_one.connect(self._sync_worker.sync_one)
+        self._request_sync_many.connect(self._sync_worker.sync_many)
+        self._sync_worker.finished.connect(self.on_sync_finished)
+        self._sync_worker.error.connect(self.on_sync_error)
+        self._sync_worker.done.connect(self._on_sync_done)
+        self._worker_thread.start()
+        
         self.init_ui()
         self.connect_signals()
         self.load_settings()
         
-        # 最後に使ったプロジェクトを読み込み
-        self.load_last_project()
+        # 最後に使ったプロジェクトはウィンドウ表示後に読み込み（起動時の表示を待たせない）
+        QTimer.singleShot(0, self.load_last_project)
+        self._check_recent_folders()
         
         self.logger.info("メインウィンドウ初期化完了")
     
@@ -160,6 +314,9 @@ class MainWindow(QMainWindow):
         
         # メニューバー
         self.create_menu_bar()
+        
+        # コンテキストメニュー
+        self.create_context_menus()
     
     def create_toolbar(self) -> QHBoxLayout:
         """ツールバー作成"""
@@ -252,6 +409,13 @@ class MainWindow(QMainWindow):
         # フォルダペアツリー（ドラッグ&ドロップ対応）
         self.folder_tree = DragDropTreeWidget()
         self.folder_tree.setHeaderLabels(["名前", "カテゴリ", "ソース", "ターゲット", "状態"])
+        # 列幅は固定の初期値を使用（更新のたびに全行を測る resizeColumnToContents は使わない）
+        folder_header = self.folder_tree.header()
+        folder_header.setSectionResizeMode(QHeaderView.Interactive)
+        folder_header.setDefaultSectionSize(200)
+        folder_header.resizeSection(0, 160)
+        folder_header.resizeSection(1, 90)
+        folder_header.resizeSection(4, 50)
         self.folder_tree.setSelectionMode(QTreeWidget.ExtendedSelection)  # 一般的な複数選択動作
         self.folder_tree.itemSelectionChanged.connect(self.on_folder_selection_changed)
         self.folder_tree.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -282,6 +446,12 @@ class MainWindow(QMainWindow):
         options_layout.addRow(self.dry_run_check)
         options_layout.addRow("並行処理数:", self.max_workers_spin)
         
+        # オプション変更時はキャッシュした SyncOptions を破棄
+        for check in (self.force_copy_check, self.create_backup_check,
+                      self.preserve_timestamp_check, self.dry_run_check):
+            check.toggled.connect(self._invalidate_sync_options)
+        self.max_workers_spin.valueChanged.connect(self._invalidate_sync_options)
+        
         layout.addWidget(options_group)
         
         return left_panel
@@ -302,9 +472,20 @@ class MainWindow(QMainWindow):
         sync_layout.addWidget(self.progress_bar)
         
         # 同期結果テーブル
-        self.sync_result_table = QTableWidget()
-        self.sync_result_table.setColumnCount(4)
-        self.sync_result_table.setHorizontalHeaderLabels(["ファイル", "状態", "サイズ", "時刻"])
+        self.sync_result_model = SyncResultModel(self)
+        self.sync_result_table = QTableView()
+        self.sync_result_table.setModel(self.sync_result_model)
+        # 行の高さは固定（行ごとの内容測定を行わない）
+        result_rows = self.sync_result_table.verticalHeader()
+        result_rows.setSectionResizeMode(QHeaderView.Fixed)
+        result_rows.setDefaultSectionSize(result_rows.minimumSectionSize())
+        # 列幅も固定の初期値を使用（追加のたびに全セルの文字列を測らない）
+        result_columns = self.sync_result_table.horizontalHeader()
+        result_columns.setSectionResizeMode(QHeaderView.Interactive)
+        result_columns.resizeSection(0, 360)
+        result_columns.resizeSection(1, 90)
+        result_columns.resizeSection(2, 80)
+        result_columns.setStretchLastSection(True)
         self.sync_result_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.sync_result_table.customContextMenuRequested.connect(self.show_result_context_menu)
         
@@ -316,8 +497,9 @@ class MainWindow(QMainWindow):
         log_tab = QWidget()
         log_layout = QVBoxLayout(log_tab)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(5000)  # 古い行は自動で削除
         self.log_text.setFont(QFont("Consolas", 9))
         
         log_layout.addWidget(self.log_text)
@@ -391,8 +573,10 @@ class MainWindow(QMainWindow):
         recent_folders_menu = QMenu("最近開いたフォルダ(&R)", self)
         folder_menu.addMenu(recent_folders_menu)
         
-        # 最近開いたフォルダリストを更新
-        self.update_recent_folders_menu(recent_folders_menu)
+        # 最近開いたフォルダリストは表示する直前に作成（起動時には作らない）
+        recent_folders_menu.aboutToShow.connect(
+            lambda: self.update_recent_folders_menu(recent_folders_menu)
+        )
         
         folder_menu.addSeparator()
         
@@ -411,6 +595,53 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
+    def create_context_menus(self):
+        """コンテキストメニュー作成（表示のたびに作り直さず、項目の表示切り替えのみ行う）"""
+        # フォルダペア
+        self._ctx_folder_pair_id: Optional[str] = None
+        self._folder_menu = QMenu(self)
+        
+        self._ctx_open_source_action = self._folder_menu.addAction("ソースフォルダを開く")
+        self._ctx_open_source_action.triggered.connect(
+            lambda: self._open_context_folder_pair_path(lambda fp: fp.source_path)
+        )
+        self._ctx_open_target_action = self._folder_menu.addAction("ターゲットフォルダを開く")
+        self._ctx_open_target_action.triggered.connect(
+            lambda: self._open_context_folder_pair_path(lambda fp: fp.target_path)
+        )
+        self._ctx_open_target_parent_action = self._folder_menu.addAction("ターゲット親フォルダを開く")
+        self._ctx_open_target_parent_action.triggered.connect(
+            lambda: self._open_context_folder_pair_path(lambda fp: os.path.dirname(fp.target_path))
+        )
+        
+        self._folder_menu.addSeparator()
+        self._folder_menu.addAction("編集").triggered.connect(self.edit_folder_pair)
+        self._folder_menu.addAction("同期実行").triggered.connect(self._sync_context_folder_pair)
+        self._folder_menu.addAction("削除").triggered.connect(self.remove_folder_pair)
+        
+        # 同期結果
+        self._ctx_result_source: Optional[str] = None
+        self._ctx_result_target: Optional[str] = None
+        self._result_menu = QMenu(self)
+        
+        self._ctx_open_source_file_action = self._result_menu.addAction("ソースファイルを開く")
+        self._ctx_open_source_file_action.triggered.connect(
+            lambda: self.open_folder(self._ctx_result_source)
+        )
+        self._ctx_open_source_file_folder_action = self._result_menu.addAction("ソースフォルダを開く")
+        self._ctx_open_source_file_folder_action.triggered.connect(
+            lambda: self.open_folder(os.path.dirname(self._ctx_result_source))
+        )
+        self._ctx_result_separator = self._result_menu.addSeparator()
+        self._ctx_open_target_file_action = self._result_menu.addAction("ターゲットファイルを開く")
+        self._ctx_open_target_file_action.triggered.connect(
+            lambda: self.open_folder(self._ctx_result_target)
+        )
+        self._ctx_open_target_file_folder_action = self._result_menu.addAction("ターゲットフォルダを開く")
+        self._ctx_open_target_file_folder_action.triggered.connect(
+            lambda: self.open_folder(os.path.dirname(self._ctx_result_target))
+        )
+    
     def connect_signals(self):
         """シグナル接続"""
         # ボタンクリックイベント
@@ -462,41 +693,72 @@ class MainWindow(QMainWindow):
     
     def refresh_project_list(self):
         """プロジェクト一覧を更新"""
-        self.project_combo.clear()
-        
-        projects = self.project_manager.list_all_projects()
-        for project in projects:
-            self.project_combo.addItem(project['name'], project['id'])
-        
-        # 現在のプロジェクトを選択
-        if self.project_manager.current_project:
-            for i in range(self.project_combo.count()):
-                if self.project_combo.itemData(i) == self.project_manager.current_project.id:
-                    self.project_combo.setCurrentIndex(i)
-                    break
+        # 項目追加のたびに on_project_changed が呼ばれないようシグナルを止める
+        self.project_combo.blockSignals(True)
+        try:
+            self.project_combo.clear()
+            
+            projects = self.project_manager.list_all_projects()
+            project_indexes: Dict[str, int] = {}
+            for index, project in enumerate(projects):
+                self.project_combo.addItem(project['name'], project['id'])
+                project_indexes[project['id']] = index
+            
+            # 現在のプロジェクトを選択
+            if self.project_manager.current_project:
+                index = project_indexes.get(self.project_manager.current_project.id, -1)
+                if index >= 0:
+                    self.project_combo.setCurrentIndex(index)
+        finally:
+            self.project_combo.blockSignals(False)
+        
+        # プロジェクト未選択の場合は、先頭に表示されたプロジェクトを1回だけ読み込む
+        if not self.project_manager.current_project and self.project_combo.count() > 0:
+            self.on_project_changed(self.project_combo.currentText())
     
     def refresh_folder_pairs(self):
-        """フォルダペア一覧を更新"""
-        self.folder_tree.clear()
+        """フォルダペア一覧を更新（folder_pair.id ごとに差分のみ反映し、選択・スクロール状態を保持）"""
+        project = self.project_manager.current_project
+        folder_pairs = project.folder_pairs if project else []
 
-        if not self.project_manager.current_project:
-            return
+        # 項目更新中は再描画しない
+        self.folder_tree.setUpdatesEnabled(False)
+        try:
+            # 削除されたフォルダペアの項目を取り除く
+            current_ids = {folder_pair.id for folder_pair in folder_pairs}
+            for folder_pair_id in [key for key in self._tree_items if key not in current_ids]:
+                item = self._tree_items.pop(folder_pair_id)
+                self.folder_tree.takeTopLevelItem(self.folder_tree.indexOfTopLevelItem(item))
 
-        for folder_pair in self.project_manager.current_project.folder_pairs:
-            item = QTreeWidgetItem(self.folder_tree)
-            item.setText(0, folder_pair.name)
-            item.setText(1, folder_pair.category)
-            item.setText(2, folder_pair.source_path)
-            item.setText(3, folder_pair.target_path)
-            item.setText(4, "有効" if folder_pair.enabled else "無効")
-            item.setData(0, Qt.UserRole, folder_pair.id)
+            for position, folder_pair in enumerate(folder_pairs):
+                item = self._tree_items.get(folder_pair.id)
+                if item is None:
+                    # 新規追加
+                    item = QTreeWidgetItem()
+                    item.setData(0, Qt.UserRole, folder_pair.id)
+                    self._tree_items[folder_pair.id] = item
+                    self.folder_tree.insertTopLevelItem(position, item)
+                elif self.folder_tree.topLevelItem(position) is not item:
+                    # 並び順が変わった場合のみ移動
+                    self.folder_tree.takeTopLevelItem(self.folder_tree.indexOfTopLevelItem(item))
+                    self.folder_tree.insertTopLevelItem(position, item)
 
-        self.folder_tree.resizeColumnToContents(0)
-        self.folder_tree.resizeColumnToContents(1)
-        self.folder_tree.resizeColumnToContents(4)
+                # 変更された列のみ更新
+                texts = (
+                    folder_pair.name,
+                    folder_pair.category,
+                    folder_pair.source_path,
+                    folder_pair.target_path,
+                    "有効" if folder_pair.enabled else "無効"
+                )
+                for column, text in enumerate(texts):
+                    if item.text(column) != text:
+                        item.setText(column, text)
 
-        # フィルタリングを適用
-        self.filter_folder_pairs()
+            # フィルタリングを適用
+            self.filter_folder_pairs()
+        finally:
+            self.folder_tree.setUpdatesEnabled(True)
 
     def filter_folder_pairs(self):
         """フォルダペア一覧をフィルタリング"""
@@ -527,6 +789,7 @@ class MainWindow(QMainWindow):
     
     def refresh_ui(self):
         """UI全体を更新"""
+        self._exists_cache.clear()
         self.refresh_project_list()
         self.update_category_filter()
         self.refresh_folder_pairs()
@@ -559,7 +822,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "プロジェクトが選択されていません。")
             return
 
-        from ui.category_dialog import CategoryDialog
+        from .category_dialog import CategoryDialog
 
         dialog = CategoryDialog(
             self.project_manager.current_project.category_settings.categories,
@@ -573,18 +836,35 @@ class MainWindow(QMainWindow):
             self.add_log_message("カテゴリを更新しました")
     
     def get_sync_options(self) -> SyncOptions:
-        """UI設定から同期オプションを取得"""
-        return SyncOptions(
-            force_copy=self.force_copy_check.isChecked(),
-            create_backup=self.create_backup_check.isChecked(),
-            preserve_timestamp=self.preserve_timestamp_check.isChecked(),
-            dry_run=self.dry_run_check.isChecked(),
-            max_workers=self.max_workers_spin.value()
-        )
+        """UI設定から同期オプションを取得（ウィジェットが変更されるまでキャッシュ）"""
+        if self._cached_options is None:
+            self._cached_options = SyncOptions(
+                force_copy=self.force_copy_check.isChecked(),
+                create_backup=self.create_backup_check.isChecked(),
+                preserve_timestamp=self.preserve_timestamp_check.isChecked(),
+                dry_run=self.dry_run_check.isChecked(),
+                max_workers=self.max_workers_spin.value()
+            )
+        return self._cached_options
+    
+    def _invalidate_sync_options(self, *args):
+        """同期オプションのキャッシュを破棄"""
+        self._cached_options = None
     
     def add_log_message(self, message: str):
-        """ログメッセージを追加"""
-        self.log_text.append(message)
+        """ログメッセージを追加（表示は 50ms ごとにまとめて反映）"""
+        self._pending_log.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log_messages(self):
+        """溜まったログメッセージを一括追加"""
+        if not self._pending_log:
+            return
+        
+        messages = "\n".join(self._pending_log)
+        self._pending_log.clear()
+        self.log_text.appendPlainText(messages)
         self.log_text.ensureCursorVisible()
     
     # イベントハンドラ
@@ -613,14 +893,33 @@ class MainWindow(QMainWindow):
         self.sync_folder_btn.setEnabled(has_selection)
     
     def on_file_changed(self, event: WatchEvent):
-        """ファイル変更イベント"""
-        self.add_log_message(f"ファイル{event.event_type}: {event.file_path}")
+        """ファイル変更イベント（監視スレッドから呼ばれるため、キューに積むだけ）"""
+        self._pending_file_events.append(event)
+    
+    def _flush_file_events(self):
+        """溜まったファイル変更イベントをフォルダペアごとにまとめて処理"""
+        pending = self._pending_file_events
+        if not pending:
+            return
+        
+        events_by_pair: Dict[str, List[WatchEvent]] = {}
+        for _ in range(len(pending)):
+            event = pending.popleft()
+            events_by_pair.setdefault(event.folder_pair_id, []).append(event)
         
-        # 自動同期が有効な場合は同期を実行
-        folder_pair = self.project_manager.get_folder_pair(event.folder_pair_id)
-        if folder_pair and folder_pair.auto_sync:
-            # TODO: 自動同期実装
-            pass
+        for folder_pair_id, events in events_by_pair.items():
+            folder_pair = self.project_manager.get_folder_pair(folder_pair_id)
+            if len(events) == 1:
+                event = events[0]
+                self.add_log_message(f"ファイル{event.event_type}: {event.file_path}")
+            else:
+                pair_name = folder_pair.name if folder_pair else folder_pair_id
+                self.add_log_message(f"ファイル変更: {pair_name} で {len(events)} 件")
+            
+            # 自動同期が有効な場合は同期を実行（フォルダペアごとに1回）
+            if folder_pair and folder_pair.auto_sync:
+                # TODO: 自動同期実装
+                pass
     
     # アクション実装
     def new_project(self):
@@ -733,28 +1032,29 @@ class MainWindow(QMainWindow):
 
         if dialog.exec() == SyncDialog.Accepted:
             folder_data = dialog.get_folder_data()
-            folder_pair = self.project_manager.add_folder_pair(
-                folder_data['name'],
-                folder_data['source_path'],
-                folder_data['target_path'],
-                folder_data['include_patterns'],
-                folder_data['exclude_patterns']
-            )
+            # 追加と各設定の反映をまとめて1回で保存
+            with self.project_manager.deferred_save():
+                folder_pair = self.project_manager.add_folder_pair(
+                    folder_data['name'],
+                    folder_data['source_path'],
+                    folder_data['target_path'],
+                    folder_data['include_patterns'],
+                    folder_data['exclude_patterns']
+                )
 
-            # カテゴリを設定
-            if folder_pair and 'category' in folder_data:
-                folder_pair.category = folder_data['category']
+                # カテゴリを設定
+                if folder_pair and 'category' in folder_data:
+                    folder_pair.category = folder_data['category']
 
-            # マッピングルールを設定
-            if folder_pair and 'mapping_rules' in folder_data and folder_data['mapping_rules']:
-                folder_pair.file_mapping_rules = folder_data['mapping_rules']
+                # マッピングルールを設定
+                if folder_pair and 'mapping_rules' in folder_data and folder_data['mapping_rules']:
+                    folder_pair.file_mapping_rules = folder_data['mapping_rules']
 
-            # リネームルールを設定
-            if folder_pair and 'rename_rules' in folder_data and folder_data['rename_rules']:
-                folder_pair.file_rename_rules = folder_data['rename_rules']
+                # リネームルールを設定
+                if folder_pair and 'rename_rules' in folder_data and folder_data['rename_rules']:
+                    folder_pair.file_rename_rules = folder_data['rename_rules']
 
             if folder_pair:
-                self.project_manager.save_current_project()
                 self.refresh_folder_pairs()
                 self.add_log_message(f"フォルダペアを追加しました: {folder_pair.name}")
     
@@ -869,43 +1169,41 @@ class MainWindow(QMainWindow):
     
     def start_sync(self, folder_pair):
         """同期開始"""
-        if self.sync_thread and self.sync_thread.isRunning():
+        if self._sync_running:
             QMessageBox.warning(self, "警告", "既に同期が実行中です。")
             return
         
         options = self.get_sync_options()
         
-        self.sync_thread = SyncThread(self.sync_engine, folder_pair, options)
-        self.sync_thread.progress.connect(self.on_sync_progress)
-        self.sync_thread.finished.connect(self.on_sync_finished)
-        self.sync_thread.error.connect(self.on_sync_error)
-        
         self.progress_bar.setValue(0)
         self.progress_label.setText(f"同期開始: {folder_pair.name}")
         self.sync_status_label.setText("同期: 実行中")
         
-        self.sync_thread.start()
+        self._pending_progress.clear()
+        self._last_progress_pct = 0
+        self._ui_flush_timer.start()
+        self._sync_running = True
+        self._request_sync_one.emit(folder_pair, options)
         self.add_log_message(f"同期開始: {folder_pair.name}")
     
     def start_multiple_sync(self, folder_pairs):
         """複数フォルダペアの同期開始"""
-        if self.sync_thread and self.sync_thread.isRunning():
+        if self._sync_running:
             QMessageBox.warning(self, "警告", "既に同期が実行中です。")
             return
         
         options = self.get_sync_options()
         
-        self.sync_thread = MultipleSyncThread(self.sync_engine, folder_pairs, options)
-        self.sync_thread.progress.connect(self.on_sync_progress)
-        self.sync_thread.finished.connect(self.on_sync_finished)
-        self.sync_thread.error.connect(self.on_sync_error)
-        
         self.progress_bar.setValue(0)
         folder_names = ", ".join([fp.name for fp in folder_pairs])
         self.progress_label.setText(f"複数同期開始: {folder_names}")
         self.sync_status_label.setText("同期: 実行中")
         
-        self.sync_thread.start()
+        self._pending_progress.clear()
+        self._last_progress_pct = 0
+        self._ui_flush_timer.start()
+        self._sync_running = True
+        self._request_sync_many.emit(folder_pairs, options)
         self.add_log_message(f"複数同期開始: {folder_names}")
     
     def start_file_watching(self):
@@ -922,6 +1220,7 @@ class MainWindow(QMainWindow):
             return
         
         if self.file_watcher.start_watching(auto_sync_pairs):
+            self._file_event_timer.start()
             self.start_watch_btn.setEnabled(False)
             self.stop_watch_btn.setEnabled(True)
             self.watch_status_label.setText("監視: 実行中")
@@ -930,31 +1229,54 @@ class MainWindow(QMainWindow):
     def stop_file_watching(self):
         """ファイル監視停止"""
         self.file_watcher.stop_watching()
+        self._file_event_timer.stop()
+        self._flush_file_events()
         self.start_watch_btn.setEnabled(True)
         self.stop_watch_btn.setEnabled(False)
         self.watch_status_label.setText("監視: 停止中")
         self.add_log_message("ファイル監視を停止しました")
     
-    def on_sync_progress(self, current, total, file_path, status):
-        """同期進捗更新"""
-        if total > 0:
-            progress = int((current / total) * 100)
-            self.progress_bar.setValue(progress)
+    def _flush_sync_progress(self):
+        """溜まった同期進捗を結果テーブル・プログレスバーに一括反映"""
+        pending = self._pending_progress
+        if not pending:
+            return
         
-        self.progress_label.setText(f"({current}/{total}) {status}: {file_path}")
+        # 同期スレッドが追加中でも取りこぼさないよう、先頭から取り出す
+        batch = [pending.popleft() for _ in range(len(pending))]
+        
+        # 結果テーブルに追加（挿入通知は1回）
+        # 最下部を表示していた場合のみ追従してスクロール（遡って確認中の位置は動かさない）
+        scroll_bar = self.sync_result_table.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 2
+        timestamp = time.time()
+        self.sync_result_model.append_rows(
+            (file_path, status, "", timestamp)  # サイズは後で
+            for _, _, file_path, status in batch
+        )
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
         
-        # 結果テーブルに追加
-        row = self.sync_result_table.rowCount()
-        self.sync_result_table.insertRow(row)
-        self.sync_result_table.setItem(row, 0, QTableWidgetItem(file_path))
-        self.sync_result_table.setItem(row, 1, QTableWidgetItem(status))
-        self.sync_result_table.setItem(row, 2, QTableWidgetItem(""))  # サイズは後で
-        self.sync_result_table.setItem(row, 3, QTableWidgetItem(QDateTime.currentDateTime().toString()))
+        # 進捗表示はバッチの最後の状態のみ
+        current, total, file_path, status = batch[-1]
+        if total > 0:
+            # パーセントが変わったときのみ更新
+            progress = current * 100 // total
+            if progress != self._last_progress_pct:
+                self._last_progress_pct = progress
+                self.progress_bar.setValue(progress)
         
-        self.sync_result_table.scrollToBottom()
+        self.progress_label.setText(f"({current}/{total}) {status}: {file_path}")
+    
+    def _stop_sync_progress(self):
+        """進捗反映タイマーを停止（未反映の進捗は反映してから）"""
+        self._ui_flush_timer.stop()
+        self._flush_sync_progress()
     
     def on_sync_finished(self, result):
         """同期完了"""
+        self._stop_sync_progress()
+        self._exists_cache.clear()
         self.progress_bar.setValue(100)
         self.progress_label.setText("同期完了")
         self.sync_status_label.setText("同期: 完了")
@@ -966,8 +1288,18 @@ class MainWindow(QMainWindow):
         self.add_log_message(message)
         self.status_bar.showMessage(message, 5000)
     
+    def _on_sync_done(self):
+        """同期ワーカーの処理終了"""
+        self._sync_running = False
+        if self._shutdown_loop is not None:
+            self._shutdown_loop.quit()
+        elif self._close_pending:
+            # 停止待ちで見送った終了処理をやり直す
+            QTimer.singleShot(0, self.close)
+    
     def on_sync_error(self, error_message):
         """同期エラー"""
+        self._stop_sync_progress()
         self.progress_label.setText("同期エラー")
         self.sync_status_label.setText("同期: エラー")
         self.add_log_message(f"同期エラー: {error_message}")
@@ -987,93 +1319,116 @@ class MainWindow(QMainWindow):
         if not folder_pair:
             return
         
-        menu = QMenu(self)
-        
-        # ソースフォルダを開く
-        if Path(folder_pair.source_path).exists():
-            open_source_action = QAction("ソースフォルダを開く", self)
-            open_source_action.triggered.connect(lambda: self.open_folder(folder_pair.source_path))
-            menu.addAction(open_source_action)
-        
-        # ターゲットフォルダを開く
-        target_path = Path(folder_pair.target_path)
-        if target_path.exists():
-            open_target_action = QAction("ターゲットフォルダを開く", self)
-            open_target_action.triggered.connect(lambda: self.open_folder(folder_pair.target_path))
-            menu.addAction(open_target_action)
-        elif target_path.parent.exists():
-            open_target_parent_action = QAction("ターゲット親フォルダを開く", self)
-            open_target_parent_action.triggered.connect(lambda: self.open_folder(str(target_path.parent)))
-            menu.addAction(open_target_parent_action)
-        
-        menu.addSeparator()
-        
-        # 編集
-        edit_action = QAction("編集", self)
-        edit_action.triggered.connect(self.edit_folder_pair)
-        menu.addAction(edit_action)
-        
-        # 同期実行
-        sync_action = QAction("同期実行", self)
-        sync_action.triggered.connect(lambda: self.start_sync(folder_pair))
-        menu.addAction(sync_action)
-        
-        # 削除
-        delete_action = QAction("削除", self)
-        delete_action.triggered.connect(self.remove_folder_pair)
-        menu.addAction(delete_action)
+        self._ctx_folder_pair_id = folder_pair_id
+        
+        # 存在するフォルダのみ「開く」を表示
+        target_exists = self._exists_cache.exists(folder_pair.target_path)
+        self._ctx_open_source_action.setVisible(self._exists_cache.exists(folder_pair.source_path))
+        self._ctx_open_target_action.setVisible(target_exists)
+        self._ctx_open_target_parent_action.setVisible(
+            not target_exists and self._exists_cache.exists(os.path.dirname(folder_pair.target_path))
+        )
         
         # メニューを表示
-        menu.exec(self.folder_tree.mapToGlobal(position))
+        self._folder_menu.exec(self.folder_tree.mapToGlobal(position))
+    
+    def _open_context_folder_pair_path(self, get_path):
+        """コンテキストメニュー対象のフォルダペアのパスを開く"""
+        folder_pair = self.project_manager.get_folder_pair(self._ctx_folder_pair_id)
+        if folder_pair:
+            self.open_folder(get_path(folder_pair))
+    
+    def _sync_context_folder_pair(self):
+        """コンテキストメニュー対象のフォルダペアを同期"""
+        folder_pair = self.project_manager.get_folder_pair(self._ctx_folder_pair_id)
+        if folder_pair:
+            self.start_sync(folder_pair)
     
     def open_folder(self, folder_path: str):
         """フォルダをエクスプローラで開く"""
+        # UNC パスは解決・存在確認に時間がかかることがあるためバックグラウンドで行う
+        if folder_path.startswith(('\\\\', '//')):
+            QThreadPool.globalInstance().start(_ResolvePathTask(folder_path, self._open_folder_signals))
+        else:
+            self._open_resolved_folder(_resolve_open_target(folder_path))
+    
+    def _open_resolved_folder(self, resolved: Tuple[str, Optional[bool], Optional[str]]):
+        """解決済みのパスをエクスプローラで開く"""
+        folder_path, is_dir, error = resolved
+        if error:
+            self.add_log_message(f"フォルダを開くのに失敗: {error}")
+            QMessageBox.critical(self, "エラー", f"フォルダを開くのに失敗しました: {error}")
+            return
+        
+        if is_dir is None:
+            QMessageBox.warning(self, "警告", f"フォルダが存在しません: {folder_path}")
+            return
+        
         try:
-            folder_path = Path(folder_path).resolve()
-            if folder_path.exists():
-                if folder_path.is_dir():
-                    # フォルダを開く
-                    QDesktopServices.openUrl(QUrl.fromLocalFile(str(folder_path)))
-                else:
-                    # ファイルの場合は親フォルダを開く
-                    QDesktopServices.openUrl(QUrl.fromLocalFile(str(folder_path.parent)))
-                
-                self.add_log_message(f"フォルダを開きました: {folder_path}")
-                
-                # 最近開いたフォルダに追加
-                self.config_manager.add_recent_folder(str(folder_path))
+            if is_dir:
+                # フォルダを開く
+                QDesktopServices.openUrl(QUrl.fromLocalFile(folder_path))
             else:
-                QMessageBox.warning(self, "警告", f"フォルダが存在しません: {folder_path}")
+                # ファイルの場合は親フォルダを開く
+                QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.dirname(folder_path)))
+            
+            self.add_log_message(f"フォルダを開きました: {folder_path}")
+            
+            # 最近開いたフォルダに追加
+            self.config_manager.add_recent_folder(folder_path)
         except Exception as e:
             self.add_log_message(f"フォルダを開くのに失敗: {e}")
             QMessageBox.critical(self, "エラー", f"フォルダを開くのに失敗しました: {e}")
     
     def update_recent_folders_menu(self, menu: QMenu):
         """最近開いたフォルダメニューを更新"""
-        menu.clear()
-        
         recent_folders = self.config_manager.app_settings.recent_folders[:10]  # 最新10件
         
+        # 表示は前回の確認結果を使い、次回表示用に改めて確認
+        self._check_recent_folders()
+        
+        # 一覧・存在確認結果とも前回と同じなら作り直さない
+        menu_key = tuple((path, self._recent_exists.get(path, True)) for path in recent_folders)
+        if menu_key == self._recent_menu_key and menu.actions():
+            return
+        self._recent_menu_key = menu_key
+        
+        # アクションはメニューを親にしているため clear() で破棄される
+        menu.clear()
+        
         if not recent_folders:
-            no_folders_action = QAction("（なし）", self)
+            no_folders_action = QAction("（なし）", menu)
             no_folders_action.setEnabled(False)
             menu.addAction(no_folders_action)
             return
         
         for folder_path in recent_folders:
-            if Path(folder_path).exists():
-                # フォルダ名だけを表示（パスが長い場合は短縮）
-                folder_name = Path(folder_path).name
-                if len(folder_path) > 50:
-                    display_text = f"{folder_name} (...{folder_path[-30:]})"
-                else:
-                    display_text = folder_path
-                
-                action = QAction(display_text, self)
+            if self._recent_exists.get(folder_path, True):  # 未確認のものは表示しておく
+                action = QAction(_recent_folder_display_text(folder_path), menu)
                 action.setToolTip(folder_path)
-                action.triggered.connect(lambda checked, path=folder_path: self.open_folder(path))
+                action.setData(folder_path)
+                action.triggered.connect(self._on_recent_folder_triggered)
                 menu.addAction(action)
     
+    @Slot()
+    def _on_recent_folder_triggered(self):
+        """最近開いたフォルダのメニュー項目を開く（パスはアクションのデータから取得）"""
+        action = self.sender()
+        if action:
+            self.open_folder(action.data())
+    
+    def _check_recent_folders(self):
+        """最近開いたフォルダの存在確認をバックグラウンドで開始"""
+        recent_folders = self.config_manager.app_settings.recent_folders[:10]
+        if recent_folders:
+            QThreadPool.globalInstance().start(
+                _FolderExistsChecker(list(recent_folders), self._recent_exists_signals)
+            )
+    
+    def _on_recent_exists_checked(self, results: Dict[str, bool]):
+        """最近開いたフォルダの存在確認結果を反映"""
+        self._recent_exists.update(results)
+    
     def open_data_folder(self):
         """データフォルダを開く"""
         data_folder = self.config_manager.data_dir
@@ -1086,52 +1441,33 @@ class MainWindow(QMainWindow):
     
     def show_result_context_menu(self, position):
         """同期結果テーブルのコンテキストメニューを表示"""
-        item = self.sync_result_table.itemAt(position)
-        if not item:
-            return
-        
-        row = item.row()
-        file_path_item = self.sync_result_table.item(row, 0)
-        if not file_path_item:
+        index = self.sync_result_table.indexAt(position)
+        if not index.isValid():
             return
         
-        file_path = file_path_item.text()
+        file_path = self.sync_result_model.file_path(index.row())
         if not file_path:
             return
         
-        menu = QMenu(self)
-        
-        # ファイルが存在する場合の操作
-        full_path = None
         current_folder_pair = self.get_current_folder_pair()
+        if not current_folder_pair:
+            return
         
-        if current_folder_pair:
-            # ソースファイルパスを構築
-            source_path = Path(current_folder_pair.source_path) / file_path
-            target_path = Path(current_folder_pair.target_path) / file_path
-            
-            if source_path.exists():
-                open_source_action = QAction("ソースファイルを開く", self)
-                open_source_action.triggered.connect(lambda: self.open_folder(str(source_path)))
-                menu.addAction(open_source_action)
-                
-                open_source_folder_action = QAction("ソースフォルダを開く", self)
-                open_source_folder_action.triggered.connect(lambda: self.open_folder(str(source_path.parent)))
-                menu.addAction(open_source_folder_action)
-                
-                menu.addSeparator()
-            
-            if target_path.exists():
-                open_target_action = QAction("ターゲットファイルを開く", self)
-                open_target_action.triggered.connect(lambda: self.open_folder(str(target_path)))
-                menu.addAction(open_target_action)
-                
-                open_target_folder_action = QAction("ターゲットフォルダを開く", self)
-                open_target_folder_action.triggered.connect(lambda: self.open_folder(str(target_path.parent)))
-                menu.addAction(open_target_folder_action)
-            
-            if menu.actions():
-                menu.exec(self.sync_result_table.mapToGlobal(position))
+        # ソース・ターゲットのファイルパスを構築
+        self._ctx_result_source = os.path.join(current_folder_pair.source_path, file_path)
+        self._ctx_result_target = os.path.join(current_folder_pair.target_path, file_path)
+        
+        # ファイルが存在する場合の操作のみ表示
+        source_exists = self._exists_cache.exists(self._ctx_result_source)
+        target_exists = self._exists_cache.exists(self._ctx_result_target)
+        self._ctx_open_source_file_action.setVisible(source_exists)
+        self._ctx_open_source_file_folder_action.setVisible(source_exists)
+        self._ctx_result_separator.setVisible(source_exists and target_exists)
+        self._ctx_open_target_file_action.setVisible(target_exists)
+        self._ctx_open_target_file_folder_action.setVisible(target_exists)
+        
+        if source_exists or target_exists:
+            self._result_menu.exec(self.sync_result_table.mapToGlobal(position))
     
     def get_current_folder_pair(self):
         """現在選択されているフォルダペアを取得"""
@@ -1150,9 +1486,12 @@ class MainWindow(QMainWindow):
         if not folder_paths:
             return
         
+        # ペア名の候補に使うフォルダ名はまとめて求める
+        folder_names = [_folder_name(folder_path) for folder_path in folder_paths]
+        
         # 複数フォルダがドロップされた場合の処理
         if len(folder_paths) == 1:
-            self.create_folder_pair_from_drop(folder_paths[0], None)
+            self.create_folder_pair_from_drop(folder_paths[0], None, folder_names[0])
         elif len(folder_paths) == 2:
             # 2つのフォルダがドロップされた場合、ソースとターゲットとして設定
             result = QMessageBox.question(
@@ -1166,18 +1505,26 @@ class MainWindow(QMainWindow):
             )
             
             if result == QMessageBox.Yes:
-                self.create_folder_pair_from_drop(folder_paths[0], folder_paths[1])
+                self.create_folder_pair_from_drop(
+                    folder_paths[0], folder_paths[1], folder_names[0], folder_names[1]
+                )
             else:
                 # 個別に処理
-                for folder_path in folder_paths:
-                    self.create_folder_pair_from_drop(folder_path, None)
+                for folder_path, folder_name in zip(folder_paths, folder_names):
+                    self.create_folder_pair_from_drop(folder_path, None, folder_name)
         else:
             # 3つ以上の場合は個別に処理
-            for folder_path in folder_paths:
-                self.create_folder_pair_from_drop(folder_path, None)
+            for folder_path, folder_name in zip(folder_paths, folder_names):
+                self.create_folder_pair_from_drop(folder_path, None, folder_name)
     
-    def create_folder_pair_from_drop(self, source_path: str, target_path: str = None):
-        """ドロップされたフォルダからフォルダペアを作成"""
+    def create_folder_pair_from_drop(
+        self,
+        source_path: str,
+        target_path: str = None,
+        source_name: Optional[str] = None,
+        target_name: Optional[str] = None
+    ):
+        """ドロップされたフォルダからフォルダペアを作成（フォルダ名は求め済みなら渡す）"""
         dialog = SyncDialog(self)
 
         # カテゴリリストを設定
@@ -1192,9 +1539,11 @@ class MainWindow(QMainWindow):
             dialog.target_path_edit.setText(target_path)
         
         # フォルダ名から適切なペア名を生成
-        source_name = Path(source_path).name
+        if source_name is None:
+            source_name = _folder_name(source_path)
         if target_path:
-            target_name = Path(target_path).name
+            if target_name is None:
+                target_name = _folder_name(target_path)
             suggested_name = f"{source_name} → {target_name}"
         else:
             suggested_name = f"{source_name} の同期"
@@ -1203,28 +1552,29 @@ class MainWindow(QMainWindow):
         
         if dialog.exec() == SyncDialog.Accepted:
             folder_data = dialog.get_folder_data()
-            folder_pair = self.project_manager.add_folder_pair(
-                folder_data['name'],
-                folder_data['source_path'],
-                folder_data['target_path'],
-                folder_data['include_patterns'],
-                folder_data['exclude_patterns']
-            )
-            
-            # カテゴリを設定
-            if folder_pair and 'category' in folder_data:
-                folder_pair.category = folder_data['category']
+            # 追加と各設定の反映をまとめて1回で保存
+            with self.project_manager.deferred_save():
+                folder_pair = self.project_manager.add_folder_pair(
+                    folder_data['name'],
+                    folder_data['source_path'],
+                    folder_data['target_path'],
+                    folder_data['include_patterns'],
+                    folder_data['exclude_patterns']
+                )
 
-            # マッピングルールを設定
-            if folder_pair and 'mapping_rules' in folder_data and folder_data['mapping_rules']:
-                folder_pair.file_mapping_rules = folder_data['mapping_rules']
+                # カテゴリを設定
+                if folder_pair and 'category' in folder_data:
+                    folder_pair.category = folder_data['category']
 
-            # リネームルールを設定
-            if folder_pair and 'rename_rules' in folder_data and folder_data['rename_rules']:
-                folder_pair.file_rename_rules = folder_data['rename_rules']
+                # マッピングルールを設定
+                if folder_pair and 'mapping_rules' in folder_data and folder_data['mapping_rules']:
+                    folder_pair.file_mapping_rules = folder_data['mapping_rules']
+
+                # リネームルールを設定
+                if folder_pair and 'rename_rules' in folder_data and folder_data['rename_rules']:
+                    folder_pair.file_rename_rules = folder_data['rename_rules']
 
             if folder_pair:
-                self.project_manager.save_current_project()
                 self.refresh_folder_pairs()
                 self.add_log_message(f"ドロップからフォルダペアを作成: {folder_pair.name}")
     
@@ -1238,14 +1588,30 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """アプリケーション終了"""
+        # 同期の停止待ち中に再度閉じられた場合は、最初の終了処理に任せる
+        if self._shutdown_loop is not None:
+            event.ignore()
+            return
+        
         # ファイル監視停止
         if self.file_watcher.is_watching():
             self.file_watcher.stop_watching()
         
-        # 同期処理停止
-        if self.sync_thread and self.sync_thread.isRunning():
+        # 同期処理停止（実行中の同期をキャンセルし、終了を待つ間もイベント処理は継続）
+        if self._sync_running:
             self.sync_engine.cancel()
-            self.sync_thread.wait(5000)  # 5秒待機
+            self.progress_label.setText("同期を停止しています...")
+            self._shutdown_loop = QEventLoop()
+            QTimer.singleShot(5000, self._shutdown_loop.quit)  # 最大5秒待機
+            self._shutdown_loop.exec()
+            self._shutdown_loop = None
+        self._worker_thread.quit()
+        if not self._worker_thread.wait(1000):
+            # コピー中のファイルがまだ終わっていない（実行中のスレッドを破棄するとプロセスが異常終了する）
+            self._close_pending = True
+            self.progress_label.setText("同期の停止を待っています...")
+            event.ignore()
+            return
         
         # 設定保存
         self.save_settings()
@@ -0,0 +1,142 @@
+"""
+振り分けルールテーブルモデル
+"""
+
+from collections import Counter
+from dataclasses import replace
+from typing import Any, Iterable, List, Optional
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from ..config.models import FileMappingRule
+
+
+class MappingRuleModel(QAbstractTableModel):
+    """振り分けルールテーブルモデル（FileMappingRule のリストをそのまま保持）"""
+
+    HEADERS = ["パターン", "振り分け先", "説明", "有効"]
+    ENABLED_COLUMN = 3
+    _FIELDS = ("pattern", "target_subpath", "description")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rules: List[FileMappingRule] = []
+        # パターンごとの件数（重複チェック用）
+        self._pattern_counts: Counter = Counter()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """行数"""
+        if parent.isValid():
+            return 0
+        return len(self._rules)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """列数"""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """セルの表示データ（有効列はチェックボックス）"""
+        if not index.isValid():
+            return None
+        rule = self._rules[index.row()]
+        if index.column() == self.ENABLED_COLUMN:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if rule.enabled else Qt.Unchecked
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return getattr(rule, self._FIELDS[index.column()])
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """ヘッダー表示データ"""
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """セルのフラグ（直接編集可能・有効列はチェック切り替え）"""
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == self.ENABLED_COLUMN:
+            return super().flags(index) | Qt.ItemIsUserCheckable
+        return super().flags(index) | Qt.ItemIsEditable
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        """セル編集内容をルールへ書き戻し"""
+        if not index.isValid():
+            return False
+        rule = self._rules[index.row()]
+        if index.column() == self.ENABLED_COLUMN:
+            if role != Qt.CheckStateRole:
+                return False
+            rule.enabled = Qt.CheckState(value) == Qt.Checked
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            return True
+
+        if role != Qt.EditRole:
+            return False
+        text = str(value).strip()
+        if self._FIELDS[index.column()] == "pattern":
+            self._replace_pattern(rule.pattern, text)
+            rule.pattern = text
+        else:
+            setattr(rule, self._FIELDS[index.column()], text)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def add_rule(self, rule: FileMappingRule):
+        """ルールを末尾に追加"""
+        row = len(self._rules)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rules.append(rule)
+        self._pattern_counts[rule.pattern] += 1
+        self.endInsertRows()
+
+    def remove_rule(self, row: int):
+        """指定行のルールを削除"""
+        if not 0 <= row < len(self._rules):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._replace_pattern(self._rules.pop(row).pattern, None)
+        self.endRemoveRows()
+
+    def replace_rule(self, row: int, rule: FileMappingRule):
+        """指定行のルールを置き換え"""
+        if not 0 <= row < len(self._rules):
+            return
+        self._replace_pattern(self._rules[row].pattern, rule.pattern)
+        self._rules[row] = rule
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def set_rules(self, rules: Iterable[FileMappingRule]):
+        """ルールを一括設定（元のルールは変更しないようコピーして保持）"""
+        self.beginResetModel()
+        self._rules = [replace(rule) for rule in rules]
+        self._pattern_counts = Counter(rule.pattern for rule in self._rules)
+        self.endResetModel()
+
+    def has_pattern(self, pattern: str) -> bool:
+        """同じパターンのルールが存在するか"""
+        return pattern in self._pattern_counts
+
+    def _replace_pattern(self, old: str, new: Optional[str]):
+        """パターン件数を更新（new が None なら削除のみ）"""
+        self._pattern_counts[old] -= 1
+        if self._pattern_counts[old] <= 0:
+            del self._pattern_counts[old]
+        if new is not None:
+            self._pattern_counts[new] += 1
+
+    def rule(self, row: int) -> Optional[FileMappingRule]:
+        """指定行のルールを取得"""
+        if 0 <= row < len(self._rules):
+            return self._rules[row]
+        return None
+
+    def rules(self) -> List[FileMappingRule]:
+        """全ルールを取得"""
+        return list(self._rules)
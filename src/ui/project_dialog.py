@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt
 
-from config.models import ProjectSettings
+from ..config.models import ProjectSettings
 
 
 class ProjectDialog(QDialog):
@@ -2,31 +2,114 @@
 同期設定ダイアログ（フォルダペア設定）
 """
 
-from typing import Optional, Dict, List
+import os
+import stat
+from collections import Counter
+from dataclasses import replace
+from functools import partial
+from typing import Callable, Optional, Dict, List, Sequence, Set, Tuple
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QTextEdit, QPushButton, QLabel, QCheckBox,
     QMessageBox, QGroupBox, QFileDialog, QListWidget,
-    QListWidgetItem, QTabWidget, QWidget, QSplitter, QComboBox
+    QListWidgetItem, QTabWidget, QWidget, QSplitter, QComboBox, QApplication,
+    QInputDialog, QTableView, QTableWidget, QTableWidgetItem, QHeaderView
 )
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import Qt, QUrl, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QDesktopServices
 
-from config.models import FolderPair, FileMappingRule, FileRenameRule
+from ..config.models import FolderPair, FileMappingRule, FileRenameRule
+from .mapping_rule_model import MappingRuleModel
 import uuid
 
 
+def _check_source_paths(source_path: str, target_path: str) -> Tuple[bool, bool, bool]:
+    """
+    ソース・ターゲットのパスを確認（stat は1回のみ）
+    
+    Returns:
+        (ソースが存在するか, ソースがフォルダか, ソースとターゲットが同じか)
+    """
+    try:
+        source_is_dir = stat.S_ISDIR(os.stat(source_path).st_mode)
+        source_exists = True
+    except OSError:
+        source_exists = source_is_dir = False
+    
+    same_path = os.path.realpath(source_path) == os.path.realpath(target_path)
+    return source_exists, source_is_dir, same_path
+
+
+class _PathCheckSignals(QObject):
+    """パス確認結果の通知"""
+    
+    finished = Signal(object, object)  # (ソース, ターゲット), _check_source_paths の戻り値
+
+
+class _PathCheckTask(QRunnable):
+    """パス確認をスレッドプールで実行（ネットワークドライブで UI を止めない）"""
+    
+    def __init__(self, source_path: str, target_path: str, signals: _PathCheckSignals):
+        super().__init__()
+        self.source_path = source_path
+        self.target_path = target_path
+        self.signals = signals
+    
+    def run(self):
+        result = _check_source_paths(self.source_path, self.target_path)
+        try:
+            self.signals.finished.emit((self.source_path, self.target_path), result)
+        except RuntimeError:
+            # 確認中にダイアログが破棄された
+            pass
+
+
 class SyncDialog(QDialog):
     """同期設定ダイアログ"""
     
+    # タブ番号
+    BASIC_TAB = 0
+    FILTER_TAB = 1
+    OPTIONS_TAB = 2
+    MAPPING_TAB = 3
+    RENAME_TAB = 4
+    
+    # 説明ラベル用スタイル（objectName で指定）
+    _STYLE_SHEET = (
+        "QLabel#help { color: #666666; font-size: 10px; }"
+        "QLabel#tabHelp { color: #666666; font-size: 10px; margin-bottom: 10px; }"
+        "QLabel#sample { font-family: 'Consolas', monospace; font-size: 9px; color: #555555; }"
+    )
+    
+    # よく使用されるパターン（名前, パターン, 除外パターンに追加するか）
+    _COMMON_PATTERNS = (
+        ("画像ファイル", ("*.jpg", "*.jpeg", "*.png", "*.gif", "*.bmp", "*.tiff"), False),
+        ("3Dファイル", ("*.fbx", "*.obj", "*.dae", "*.3ds", "*.blend"), False),
+        ("テキストファイル", ("*.txt", "*.json", "*.xml", "*.csv"), False),
+        ("一時ファイル除外", ("*.tmp", "*.temp", "*.bak", "*~", "*.swp"), True),
+    )
+    
+    # サンプル振り分けルール（名前, パターン, 振り分け先）
+    _SAMPLE_RULES = (
+        ("ボタン用ルール", "button_*", "ui/buttons"),
+        ("アイコン用ルール", "icon_*", "ui/icons"),
+        ("背景用ルール", "bg_*", "backgrounds"),
+        ("UI画像用ルール", "regex:.*_ui\\.(png|jpg)", "ui"),
+    )
+    
     def __init__(self, parent=None, folder_pair: Optional[FolderPair] = None):
         super().__init__(parent)
         
         self.folder_pair = folder_pair
         self.is_edit_mode = folder_pair is not None
         
+        # OK 時のパス確認（バックグラウンドで実行）
+        self._pending_path_check: Optional[Tuple[str, str]] = None
+        self._path_check_signals = _PathCheckSignals(self)
+        self._path_check_signals.finished.connect(self._on_paths_checked)
+        
         self.init_ui()
         
         if self.is_edit_mode:
@@ -38,33 +121,36 @@ class SyncDialog(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
         self.setMinimumSize(600, 500)
+        # 説明ラベルのスタイルはダイアログでまとめて定義（ラベルごとに解析しない）
+        self.setStyleSheet(self._STYLE_SHEET)
         
         layout = QVBoxLayout(self)
         
-        # タブウィジェット
-        tab_widget = QTabWidget()
-        
-        # 基本設定タブ
-        basic_tab = self.create_basic_tab()
-        tab_widget.addTab(basic_tab, "基本設定")
-        
-        # フィルタ設定タブ
-        filter_tab = self.create_filter_tab()
-        tab_widget.addTab(filter_tab, "フィルタ設定")
-        
-        # オプション設定タブ
-        options_tab = self.create_options_tab()
-        tab_widget.addTab(options_tab, "オプション")
+        # タブウィジェット（基本設定タブ以外は初めて表示されたときに構築）
+        self.tab_widget = QTabWidget()
+        self._tab_builders: Dict[int, Tuple[str, Callable[[], QWidget]]] = {
+            self.BASIC_TAB: ("基本設定", self.create_basic_tab),
+            self.FILTER_TAB: ("フィルタ設定", self.create_filter_tab),
+            self.OPTIONS_TAB: ("オプション", self.create_options_tab),
+            self.MAPPING_TAB: ("ファイル振り分け", self.create_mapping_tab),
+            self.RENAME_TAB: ("ファイル名変更", self.create_rename_tab),
+        }
+        self._built: Set[int] = set()
+        # 未構築タブへのデータ読み込み（タブ構築時に実行）
+        self._pending_loads: Dict[int, Callable[[], None]] = {}
+        # 含む/除外パターンごとの件数（重複チェック用）
+        self._include_counts: Counter = Counter()
+        self._exclude_counts: Counter = Counter()
         
-        # ファイルマッピングタブ
-        mapping_tab = self.create_mapping_tab()
-        tab_widget.addTab(mapping_tab, "ファイル振り分け")
+        for index in sorted(self._tab_builders):
+            name, _ = self._tab_builders[index]
+            self.tab_widget.addTab(QWidget(), name)
         
-        # ファイルリネームタブ
-        rename_tab = self.create_rename_tab()
-        tab_widget.addTab(rename_tab, "ファイル名変更")
+        # 基本設定タブのウィジェットは呼び出し側から直接参照されるため即時構築
+        self._ensure_tab_built(self.BASIC_TAB)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
-        layout.addWidget(tab_widget)
+        layout.addWidget(self.tab_widget)
         
         # ボタン
         button_layout = QHBoxLayout()
@@ -84,6 +170,31 @@ class SyncDialog(QDialog):
         # デフォルトボタン設定
         self.ok_button.setDefault(True)
     
+    def _ensure_tab_built(self, index: int):
+        """タブの中身が未構築なら構築してプレースホルダーと差し替え"""
+        if index in self._built or index not in self._tab_builders:
+            return
+        
+        self._built.add(index)
+        name, builder = self._tab_builders[index]
+        widget = builder()
+        
+        # 差し替え中の currentChanged で再入しないようにシグナルを止める
+        was_current = self.tab_widget.currentIndex() == index
+        self.tab_widget.blockSignals(True)
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, name)
+        if was_current:
+            self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        if placeholder is not None:
+            placeholder.deleteLater()
+        
+        loader = self._pending_loads.pop(index, None)
+        if loader:
+            loader()
+    
     def create_basic_tab(self) -> QWidget:
         """基本設定タブ作成"""
         tab = QWidget()
@@ -177,7 +288,7 @@ class SyncDialog(QDialog):
                              "例: *.jpg, *.png, *.fbx\n"
                              "正規表現: regex:.*\\.jpe?g$")
         include_help.setWordWrap(True)
-        include_help.setStyleSheet("color: #666666; font-size: 10px;")
+        include_help.setObjectName("help")
         include_layout.addWidget(include_help)
         
         # 含むパターンリスト
@@ -211,7 +322,7 @@ class SyncDialog(QDialog):
                              "例: *.tmp, *.bak, *~\n"
                              "正規表現: regex:.*\\.temp$")
         exclude_help.setWordWrap(True)
-        exclude_help.setStyleSheet("color: #666666; font-size: 10px;")
+        exclude_help.setObjectName("help")
         exclude_layout.addWidget(exclude_help)
         
         # 除外パターンリスト
@@ -241,16 +352,9 @@ class SyncDialog(QDialog):
         common_group = QGroupBox("よく使用されるパターン")
         common_layout = QVBoxLayout(common_group)
         
-        common_patterns = [
-            ("画像ファイル", ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.bmp", "*.tiff"]),
-            ("3Dファイル", ["*.fbx", "*.obj", "*.dae", "*.3ds", "*.blend"]),
-            ("テキストファイル", ["*.txt", "*.json", "*.xml", "*.csv"]),
-            ("一時ファイル除外", ["*.tmp", "*.temp", "*.bak", "*~", "*.swp"])
-        ]
-        
-        for name, patterns in common_patterns:
+        for name, patterns, exclude in self._COMMON_PATTERNS:
             btn = QPushButton(f"{name}を追加")
-            btn.clicked.connect(lambda checked, p=patterns: self.add_common_patterns(p))
+            btn.clicked.connect(partial(self.add_common_patterns, patterns, exclude))
             common_layout.addWidget(btn)
         
         layout.addWidget(common_group)
@@ -293,7 +397,7 @@ class SyncDialog(QDialog):
             "例：ボタン画像は ui/buttons フォルダ、アイコン画像は ui/icons フォルダ など"
         )
         help_text.setWordWrap(True)
-        help_text.setStyleSheet("color: #666666; font-size: 10px; margin-bottom: 10px;")
+        help_text.setObjectName("tabHelp")
         layout.addWidget(help_text)
         
         # マッピング有効化
@@ -322,10 +426,9 @@ class SyncDialog(QDialog):
         mapping_layout.addLayout(mapping_btn_layout)
         
         # マッピングルールテーブル
-        from PySide6.QtWidgets import QTableWidget, QHeaderView
-        self.mapping_table = QTableWidget()
-        self.mapping_table.setColumnCount(4)
-        self.mapping_table.setHorizontalHeaderLabels(["パターン", "振り分け先", "説明", "有効"])
+        self.mapping_model = MappingRuleModel(self)
+        self.mapping_table = QTableView()
+        self.mapping_table.setModel(self.mapping_model)
         
         # テーブルの列幅調整
         header = self.mapping_table.horizontalHeader()
@@ -348,22 +451,15 @@ class SyncDialog(QDialog):
             "• se_*.wav → audio/se （効果音）\n"
             "• regex:.*_ui\\.(png|jpg) → ui （UI画像全般）"
         )
-        sample_text.setStyleSheet("font-family: 'Consolas', monospace; font-size: 9px; color: #555555;")
+        sample_text.setObjectName("sample")
         sample_layout.addWidget(sample_text)
         
         # サンプル追加ボタン
         sample_btn_layout = QHBoxLayout()
         
-        sample_buttons = [
-            ("ボタン用ルール", "button_*", "ui/buttons"),
-            ("アイコン用ルール", "icon_*", "ui/icons"),
-            ("背景用ルール", "bg_*", "backgrounds"),
-            ("UI画像用ルール", "regex:.*_ui\\.(png|jpg)", "ui"),
-        ]
-        
-        for name, pattern, target in sample_buttons:
+        for name, pattern, target in self._SAMPLE_RULES:
             btn = QPushButton(name)
-            btn.clicked.connect(lambda checked, p=pattern, t=target, n=name: self.add_sample_rule(n, p, t))
+            btn.clicked.connect(partial(self.add_sample_rule, name, pattern, target))
             sample_btn_layout.addWidget(btn)
         
         sample_btn_layout.addStretch()
@@ -384,7 +480,7 @@ class SyncDialog(QDialog):
             "法則性のない自由な名前変更が可能です。"
         )
         help_text.setWordWrap(True)
-        help_text.setStyleSheet("color: #666666; font-size: 10px; margin-bottom: 10px;")
+        help_text.setObjectName("tabHelp")
         layout.addWidget(help_text)
         
         # リネーム有効化
@@ -416,7 +512,6 @@ class SyncDialog(QDialog):
         rename_layout.addLayout(rename_btn_layout)
         
         # リネームルールテーブル
-        from PySide6.QtWidgets import QTableWidget, QHeaderView
         self.rename_table = QTableWidget()
         self.rename_table.setColumnCount(4)
         self.rename_table.setHorizontalHeaderLabels(["元のファイル名", "新しいファイル名", "説明", "有効"])
@@ -441,17 +536,32 @@ class SyncDialog(QDialog):
             "• test_file.png → final_icon.png\n"
             "• old_name.txt → 新しい名前.txt"
         )
-        example_text.setStyleSheet("font-family: 'Consolas', monospace; font-size: 9px; color: #555555;")
+        example_text.setObjectName("sample")
         example_layout.addWidget(example_text)
         layout.addWidget(example_group)
         
         return tab
     
     def load_folder_pair_data(self):
-        """フォルダペアデータを読み込み"""
+        """フォルダペアデータを読み込み（未構築タブは構築時に読み込む）"""
         if not self.folder_pair:
             return
-
+        
+        loaders = {
+            self.BASIC_TAB: self._load_basic_data,
+            self.FILTER_TAB: self._load_filter_data,
+            self.OPTIONS_TAB: self._load_options_data,
+            self.MAPPING_TAB: self._load_mapping_data,
+            self.RENAME_TAB: self._load_rename_data,
+        }
+        for index, loader in loaders.items():
+            if index in self._built:
+                loader()
+            else:
+                self._pending_loads[index] = loader
+    
+    def _load_basic_data(self):
+        """基本設定タブへ読み込み"""
         # 基本情報
         self.name_edit.setText(self.folder_pair.name)
         self.source_path_edit.setText(self.folder_pair.source_path)
@@ -461,56 +571,82 @@ class SyncDialog(QDialog):
         if hasattr(self.folder_pair, 'category'):
             self.category_combo.setCurrentText(self.folder_pair.category)
         
-        # フィルタ設定
+        # 情報表示
+        if hasattr(self, 'id_label'):
+            self.id_label.setText(self.folder_pair.id)
+            last_sync = self.folder_pair.last_sync or "未同期"
+            self.last_sync_label.setText(last_sync)
+    
+    def _load_filter_data(self):
+        """フィルタ設定タブへ読み込み"""
         filter_rule = self.folder_pair.filter_rule
         self.filter_enabled_check.setChecked(filter_rule.enabled)
         
-        # 含むパターン
-        for pattern in filter_rule.include_patterns:
-            item = QListWidgetItem(pattern)
-            self.include_list.addItem(item)
-        
-        # 除外パターン
-        for pattern in filter_rule.exclude_patterns:
-            item = QListWidgetItem(pattern)
-            self.exclude_list.addItem(item)
-        
-        # オプション
+        # 含むパターン・除外パターン（まとめて追加し再描画は1回）
+        for list_widget, counts, patterns in (
+            (self.include_list, self._include_counts, filter_rule.include_patterns),
+            (self.exclude_list, self._exclude_counts, filter_rule.exclude_patterns),
+        ):
+            list_widget.setUpdatesEnabled(False)
+            list_widget.blockSignals(True)
+            list_widget.addItems(patterns)
+            counts.update(patterns)
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+    
+    def _load_options_data(self):
+        """オプションタブへ読み込み"""
         self.enabled_check.setChecked(self.folder_pair.enabled)
         self.auto_sync_check.setChecked(self.folder_pair.auto_sync)
         self.backup_enabled_check.setChecked(self.folder_pair.backup_enabled)
-        
-        # ファイルマッピング
+    
+    def _load_mapping_data(self):
+        """ファイル振り分けタブへ読み込み"""
         if hasattr(self.folder_pair, 'file_mapping_rules'):
             self.mapping_enabled_check.setChecked(len(self.folder_pair.file_mapping_rules) > 0)
             self.load_mapping_rules()
-        
-        # ファイルリネーム
+    
+    def _load_rename_data(self):
+        """ファイル名変更タブへ読み込み"""
         if hasattr(self.folder_pair, 'file_rename_rules'):
             self.rename_enabled_check.setChecked(len(self.folder_pair.file_rename_rules) > 0)
             self.load_rename_rules()
-        
-        # 情報表示
-        if hasattr(self, 'id_label'):
-            self.id_label.setText(self.folder_pair.id)
-            last_sync = self.folder_pair.last_sync or "未同期"
-            self.last_sync_label.setText(last_sync)
     
     def get_folder_data(self) -> Dict:
-        """フォルダペアデータを取得"""
-        # 含むパターン収集
-        include_patterns = []
-        for i in range(self.include_list.count()):
-            pattern = self.include_list.item(i).text().strip()
-            if pattern:
-                include_patterns.append(pattern)
-        
-        # 除外パターン収集
-        exclude_patterns = []
-        for i in range(self.exclude_list.count()):
-            pattern = self.exclude_list.item(i).text().strip()
-            if pattern:
-                exclude_patterns.append(pattern)
+        """フォルダペアデータを取得（未構築タブは読み込み元の値・既定値を使用）"""
+        folder_pair = self.folder_pair
+        filter_rule = folder_pair.filter_rule if folder_pair else None
+        
+        # フィルタ設定
+        if self.FILTER_TAB in self._built:
+            include_patterns = self._collect_patterns(self.include_list)
+            exclude_patterns = self._collect_patterns(self.exclude_list)
+            filter_enabled = self.filter_enabled_check.isChecked()
+        else:
+            include_patterns = list(filter_rule.include_patterns) if filter_rule else []
+            exclude_patterns = list(filter_rule.exclude_patterns) if filter_rule else []
+            filter_enabled = filter_rule.enabled if filter_rule else True
+        
+        # オプション
+        if self.OPTIONS_TAB in self._built:
+            enabled = self.enabled_check.isChecked()
+            auto_sync = self.auto_sync_check.isChecked()
+            backup_enabled = self.backup_enabled_check.isChecked()
+        else:
+            enabled = folder_pair.enabled if folder_pair else True
+            auto_sync = folder_pair.auto_sync if folder_pair else False
+            backup_enabled = folder_pair.backup_enabled if folder_pair else True
+        
+        # ファイル振り分け・ファイル名変更
+        if self.MAPPING_TAB in self._built:
+            mapping_rules = self.get_mapping_rules() if self.mapping_enabled_check.isChecked() else []
+        else:
+            mapping_rules = list(getattr(folder_pair, 'file_mapping_rules', []))
+        
+        if self.RENAME_TAB in self._built:
+            rename_rules = self.get_rename_rules() if self.rename_enabled_check.isChecked() else []
+        else:
+            rename_rules = list(getattr(folder_pair, 'file_rename_rules', []))
         
         return {
             'name': self.name_edit.text().strip(),
@@ -519,16 +655,23 @@ class SyncDialog(QDialog):
             'category': self.category_combo.currentText().strip() or "未分類",
             'include_patterns': include_patterns,
             'exclude_patterns': exclude_patterns,
-            'filter_enabled': self.filter_enabled_check.isChecked(),
-            'mapping_rules': self.get_mapping_rules() if self.mapping_enabled_check.isChecked() else [],
-            'rename_rules': self.get_rename_rules() if self.rename_enabled_check.isChecked() else [],
-            'enabled': self.enabled_check.isChecked(),
-            'auto_sync': self.auto_sync_check.isChecked(),
-            'backup_enabled': self.backup_enabled_check.isChecked()
+            'filter_enabled': filter_enabled,
+            'mapping_rules': mapping_rules,
+            'rename_rules': rename_rules,
+            'enabled': enabled,
+            'auto_sync': auto_sync,
+            'backup_enabled': backup_enabled
         }
     
+    @staticmethod
+    def _collect_patterns(list_widget: QListWidget) -> List[str]:
+        """リストのパターンを表示順に収集（空文字は除外）"""
+        item = list_widget.item
+        patterns = [item(i).text().strip() for i in range(list_widget.count())]
+        return [pattern for pattern in patterns if pattern]
+    
     def validate_input(self) -> bool:
-        """入力値検証"""
+        """入力値検証（文字列のみ。ファイルシステムの確認は accept_dialog から非同期に実行）"""
         name = self.name_edit.text().strip()
         source_path = self.source_path_edit.text().strip()
         target_path = self.target_path_edit.text().strip()
@@ -548,27 +691,43 @@ class SyncDialog(QDialog):
             self.target_path_edit.setFocus()
             return False
         
-        # パス存在チェック
-        source = Path(source_path)
-        if not source.exists():
-            result = QMessageBox.question(
+        # 同じパスチェック（文字列比較のみ。実体の比較は _on_paths_checked で実施）
+        if os.path.normcase(os.path.normpath(source_path)) == os.path.normcase(os.path.normpath(target_path)):
+            QMessageBox.warning(self, "入力エラー", "ソースフォルダとターゲットフォルダが同じです。")
+            return False
+        
+        return True
+    
+    def _on_paths_checked(self, paths: Tuple[str, str], result: Tuple[bool, bool, bool]):
+        """パス確認完了（OK 確定またはエラー表示）"""
+        if paths != self._pending_path_check:
+            return
+        self._pending_path_check = None
+        QApplication.restoreOverrideCursor()
+        self.ok_button.setEnabled(True)
+        if not self.isVisible():
+            return
+        
+        source_path = paths[0]
+        source_exists, source_is_dir, same_path = result
+        if not source_exists:
+            answer = QMessageBox.question(
                 self, "確認",
                 f"ソースフォルダが存在しません: {source_path}\n\n続行しますか？",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
-            if result == QMessageBox.No:
-                return False
-        elif not source.is_dir():
+            if answer == QMessageBox.No:
+                return
+        elif not source_is_dir:
             QMessageBox.warning(self, "入力エラー", f"ソースパスがディレクトリではありません: {source_path}")
-            return False
+            return
         
-        # 同じパスチェック
-        if Path(source_path).resolve() == Path(target_path).resolve():
+        if same_path:
             QMessageBox.warning(self, "入力エラー", "ソースフォルダとターゲットフォルダが同じです。")
-            return False
+            return
         
-        return True
+        self.accept()
     
     def browse_source_folder(self):
         """ソースフォルダを選択"""
@@ -588,21 +747,18 @@ class SyncDialog(QDialog):
     
     def add_include_pattern(self):
         """含むパターン追加"""
-        from PySide6.QtWidgets import QInputDialog
-        
         pattern, ok = QInputDialog.getText(
             self, "パターン追加", "含むパターンを入力してください:"
         )
         
         if ok and pattern.strip():
-            item = QListWidgetItem(pattern.strip())
-            self.include_list.addItem(item)
+            self._add_pattern_item(self.include_list, self._include_counts, pattern.strip())
     
     def remove_include_pattern(self):
         """含むパターン削除"""
         current_item = self.include_list.currentItem()
         if current_item:
-            self.include_list.takeItem(self.include_list.row(current_item))
+            self._remove_pattern_item(self.include_list, self._include_counts, current_item)
     
     def edit_include_pattern(self):
         """含むパターン編集"""
@@ -610,33 +766,28 @@ class SyncDialog(QDialog):
         if not current_item:
             return
         
-        from PySide6.QtWidgets import QInputDialog
-        
         pattern, ok = QInputDialog.getText(
             self, "パターン編集", "含むパターンを編集してください:",
             text=current_item.text()
         )
         
         if ok and pattern.strip():
-            current_item.setText(pattern.strip())
+            self._rename_pattern_item(self._include_counts, current_item, pattern.strip())
     
     def add_exclude_pattern(self):
         """除外パターン追加"""
-        from PySide6.QtWidgets import QInputDialog
-        
         pattern, ok = QInputDialog.getText(
             self, "パターン追加", "除外パターンを入力してください:"
         )
         
         if ok and pattern.strip():
-            item = QListWidgetItem(pattern.strip())
-            self.exclude_list.addItem(item)
+            self._add_pattern_item(self.exclude_list, self._exclude_counts, pattern.strip())
     
     def remove_exclude_pattern(self):
         """除外パターン削除"""
         current_item = self.exclude_list.currentItem()
         if current_item:
-            self.exclude_list.takeItem(self.exclude_list.row(current_item))
+            self._remove_pattern_item(self.exclude_list, self._exclude_counts, current_item)
     
     def edit_exclude_pattern(self):
         """除外パターン編集"""
@@ -644,35 +795,50 @@ class SyncDialog(QDialog):
         if not current_item:
             return
         
-        from PySide6.QtWidgets import QInputDialog
-        
         pattern, ok = QInputDialog.getText(
             self, "パターン編集", "除外パターンを編集してください:",
             text=current_item.text()
         )
         
         if ok and pattern.strip():
-            current_item.setText(pattern.strip())
+            self._rename_pattern_item(self._exclude_counts, current_item, pattern.strip())
     
-    def add_common_patterns(self, patterns: List[str]):
-        """よく使用されるパターンを追加"""
-        # デフォルトで含むパターンに追加（一時ファイルは除外に）
-        if "一時ファイル" in str(patterns):
-            list_widget = self.exclude_list
+    def add_common_patterns(self, patterns: Sequence[str], exclude: bool = False, checked: bool = False):
+        """よく使用されるパターンを追加（exclude が True なら除外パターンに追加）"""
+        if exclude:
+            list_widget, counts = self.exclude_list, self._exclude_counts
         else:
-            list_widget = self.include_list
+            list_widget, counts = self.include_list, self._include_counts
         
         for pattern in patterns:
             # 重複チェック
-            exists = False
-            for i in range(list_widget.count()):
-                if list_widget.item(i).text() == pattern:
-                    exists = True
-                    break
-            
-            if not exists:
-                item = QListWidgetItem(pattern)
-                list_widget.addItem(item)
+            if pattern not in counts:
+                self._add_pattern_item(list_widget, counts, pattern)
+    
+    @staticmethod
+    def _add_pattern_item(list_widget: QListWidget, counts: Counter, pattern: str):
+        """パターンをリストに追加"""
+        list_widget.addItem(QListWidgetItem(pattern))
+        counts[pattern] += 1
+    
+    @staticmethod
+    def _remove_pattern_item(list_widget: QListWidget, counts: Counter, item: QListWidgetItem):
+        """パターンをリストから削除"""
+        pattern = item.text()
+        list_widget.takeItem(list_widget.row(item))
+        counts[pattern] -= 1
+        if counts[pattern] <= 0:
+            del counts[pattern]
+    
+    @staticmethod
+    def _rename_pattern_item(counts: Counter, item: QListWidgetItem, pattern: str):
+        """リスト内のパターンを変更"""
+        old = item.text()
+        counts[old] -= 1
+        if counts[old] <= 0:
+            del counts[old]
+        item.setText(pattern)
+        counts[pattern] += 1
     
     def open_source_folder(self):
         """ソースフォルダを開く"""
@@ -719,8 +885,6 @@ class SyncDialog(QDialog):
     
     def add_mapping_rule(self):
         """マッピングルールを追加"""
-        from PySide6.QtWidgets import QInputDialog, QDialog, QVBoxLayout, QFormLayout
-        
         # カスタムダイアログを作成
         dialog = QDialog(self)
         dialog.setWindowTitle("振り分けルール追加")
@@ -766,18 +930,14 @@ class SyncDialog(QDialog):
     
     def edit_mapping_rule(self):
         """マッピングルールを編集"""
-        current_row = self.mapping_table.currentRow()
+        current_row = self.mapping_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.information(self, "情報", "編集するルールを選択してください。")
             return
         
         # 現在の値を取得
-        pattern_item = self.mapping_table.item(current_row, 0)
-        target_item = self.mapping_table.item(current_row, 1)
-        desc_item = self.mapping_table.item(current_row, 2)
-        enabled_item = self.mapping_table.item(current_row, 3)
-        
-        if not all([pattern_item, target_item, desc_item, enabled_item]):
+        rule = self.mapping_model.rule(current_row)
+        if rule is None:
             return
         
         # カスタムダイアログを作成
@@ -789,11 +949,11 @@ class SyncDialog(QDialog):
         layout = QVBoxLayout(dialog)
         form_layout = QFormLayout()
         
-        pattern_edit = QLineEdit(pattern_item.text())
-        target_edit = QLineEdit(target_item.text())
-        desc_edit = QLineEdit(desc_item.text())
+        pattern_edit = QLineEdit(rule.pattern)
+        target_edit = QLineEdit(rule.target_subpath)
+        desc_edit = QLineEdit(rule.description)
         enabled_check = QCheckBox("有効")
-        enabled_check.setChecked(enabled_item.text() == "有効")
+        enabled_check.setChecked(rule.enabled)
         
         form_layout.addRow("パターン:", pattern_edit)
         form_layout.addRow("振り分け先:", target_edit)
@@ -816,92 +976,77 @@ class SyncDialog(QDialog):
         layout.addLayout(btn_layout)
         
         if dialog.exec() == QDialog.Accepted:
-            pattern_item.setText(pattern_edit.text().strip())
-            target_item.setText(target_edit.text().strip())
-            desc_item.setText(desc_edit.text().strip())
-            enabled_item.setText("有効" if enabled_check.isChecked() else "無効")
+            self.mapping_model.replace_rule(current_row, replace(
+                rule,
+                pattern=pattern_edit.text().strip(),
+                target_subpath=target_edit.text().strip(),
+                description=desc_edit.text().strip(),
+                enabled=enabled_check.isChecked()
+            ))
     
     def remove_mapping_rule(self):
         """マッピングルールを削除"""
-        current_row = self.mapping_table.currentRow()
+        current_row = self.mapping_table.currentIndex().row()
         if current_row < 0:
             QMessageBox.information(self, "情報", "削除するルールを選択してください。")
             return
         
-        pattern_item = self.mapping_table.item(current_row, 0)
-        if pattern_item:
+        rule = self.mapping_model.rule(current_row)
+        if rule:
             result = QMessageBox.question(
                 self, "確認",
-                f"ルール '{pattern_item.text()}' を削除しますか？",
+                f"ルール '{rule.pattern}' を削除しますか？",
                 QMessageBox.Yes | QMessageBox.No,
                 QMessageBox.No
             )
             
             if result == QMessageBox.Yes:
-                self.mapping_table.removeRow(current_row)
+                self.mapping_model.remove_rule(current_row)
     
-    def add_sample_rule(self, name: str, pattern: str, target: str):
+    def add_sample_rule(self, name: str, pattern: str, target: str, checked: bool = False):
         """サンプルルールを追加"""
         # 重複チェック
-        for row in range(self.mapping_table.rowCount()):
-            pattern_item = self.mapping_table.item(row, 0)
-            if pattern_item and pattern_item.text() == pattern:
-                QMessageBox.information(self, "情報", f"パターン '{pattern}' は既に存在します。")
-                return
+        if self.mapping_model.has_pattern(pattern):
+            QMessageBox.information(self, "情報", f"パターン '{pattern}' は既に存在します。")
+            return
         
         description = name.replace("用ルール", "")
         self.add_mapping_rule_to_table(pattern, target, description, True)
     
     def add_mapping_rule_to_table(self, pattern: str, target: str, description: str, enabled: bool):
         """マッピングルールをテーブルに追加"""
-        from PySide6.QtWidgets import QTableWidgetItem
-        
-        row = self.mapping_table.rowCount()
-        self.mapping_table.insertRow(row)
-        
-        self.mapping_table.setItem(row, 0, QTableWidgetItem(pattern))
-        self.mapping_table.setItem(row, 1, QTableWidgetItem(target))
-        self.mapping_table.setItem(row, 2, QTableWidgetItem(description))
-        self.mapping_table.setItem(row, 3, QTableWidgetItem("有効" if enabled else "無効"))
+        self.mapping_model.add_rule(FileMappingRule(
+            id=str(uuid.uuid4()),
+            pattern=pattern,
+            target_subpath=target,
+            description=description,
+            enabled=enabled
+        ))
     
     def load_mapping_rules(self):
         """マッピングルールをテーブルに読み込み"""
         if not self.folder_pair or not hasattr(self.folder_pair, 'file_mapping_rules'):
             return
         
-        self.mapping_table.setRowCount(0)
-        for rule in self.folder_pair.file_mapping_rules:
-            self.add_mapping_rule_to_table(rule.pattern, rule.target_subpath, rule.description, rule.enabled)
+        self.mapping_model.set_rules(self.folder_pair.file_mapping_rules)
     
     def get_mapping_rules(self) -> List[FileMappingRule]:
         """テーブルからマッピングルールを取得"""
-        rules = []
-        for row in range(self.mapping_table.rowCount()):
-            pattern_item = self.mapping_table.item(row, 0)
-            target_item = self.mapping_table.item(row, 1)
-            desc_item = self.mapping_table.item(row, 2)
-            enabled_item = self.mapping_table.item(row, 3)
-            
-            if pattern_item and target_item and desc_item and enabled_item:
-                rule = FileMappingRule(
-                    id=str(uuid.uuid4()),
-                    pattern=pattern_item.text(),
-                    target_subpath=target_item.text(),
-                    description=desc_item.text(),
-                    enabled=enabled_item.text() == "有効"
-                )
-                rules.append(rule)
-        
-        return rules
+        return self.mapping_model.rules()
     
     def load_rename_rules(self):
         """リネームルールをテーブルに読み込み"""
         if not self.folder_pair or not hasattr(self.folder_pair, 'file_rename_rules'):
             return
         
+        # 行追加ごとの再描画を避ける
+        self.rename_table.setUpdatesEnabled(False)
         self.rename_table.setRowCount(0)
         for rule in self.folder_pair.file_rename_rules:
-            self.add_rename_rule_to_table(rule.source_filename, rule.target_filename, rule.description, rule.enabled)
+            self.add_rename_rule_to_table(
+                rule.source_filename, rule.target_filename, rule.description, rule.enabled, rule.id
+            )
+        self.rename_table.setUpdatesEnabled(True)
     
     def add_rename_rule(self):
         """リネームルール追加"""
@@ -966,14 +1111,16 @@ class SyncDialog(QDialog):
                     rule['enabled']
                 )
     
-    def add_rename_rule_to_table(self, source: str, target: str, description: str, enabled: bool):
-        """リネームルールをテーブルに追加"""
-        from PySide6.QtWidgets import QTableWidgetItem
-        
+    def add_rename_rule_to_table(
+        self, source: str, target: str, description: str, enabled: bool, rule_id: Optional[str] = None
+    ):
+        """リネームルールをテーブルに追加（ルール ID は元のファイル名セルに保持）"""
         row = self.rename_table.rowCount()
         self.rename_table.insertRow(row)
         
-        self.rename_table.setItem(row, 0, QTableWidgetItem(source))
+        source_item = QTableWidgetItem(source)
+        source_item.setData(Qt.UserRole, rule_id or str(uuid.uuid4()))
+        self.rename_table.setItem(row, 0, source_item)
         self.rename_table.setItem(row, 1, QTableWidgetItem(target))
         self.rename_table.setItem(row, 2, QTableWidgetItem(description))
         self.rename_table.setItem(row, 3, QTableWidgetItem("有効" if enabled else "無効"))
@@ -989,7 +1136,7 @@ class SyncDialog(QDialog):
             
             if source_item and target_item and desc_item and enabled_item:
                 rule = FileRenameRule(
-                    id=str(uuid.uuid4()),
+                    id=source_item.data(Qt.UserRole) or str(uuid.uuid4()),
                     source_filename=source_item.text(),
                     target_filename=target_item.text(),
                     description=desc_item.text(),
@@ -1001,8 +1148,23 @@ class SyncDialog(QDialog):
     
     def accept_dialog(self):
         """OK ボタンクリック"""
-        if self.validate_input():
-            self.accept()
+        if self._pending_path_check is not None or not self.validate_input():
+            return
+        
+        # パスの確認はスレッドプールで行い、完了まで OK を無効化
+        paths = (self.source_path_edit.text().strip(), self.target_path_edit.text().strip())
+        self._pending_path_check = paths
+        self.ok_button.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+        QThreadPool.globalInstance().start(_PathCheckTask(paths[0], paths[1], self._path_check_signals))
+    
+    def reject(self):
+        """キャンセル（確認中のパスがあれば結果を破棄）"""
+        if self._pending_path_check is not None:
+            self._pending_path_check = None
+            QApplication.restoreOverrideCursor()
+            self.ok_button.setEnabled(True)
+        super().reject()
 
 
 class RenameRuleDialog(QDialog):
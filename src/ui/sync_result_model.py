@@ -0,0 +1,86 @@
+"""
+同期結果テーブルモデル
+"""
+
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+class SyncResultModel(QAbstractTableModel):
+    """同期結果テーブルモデル（列ごとのリストで保持し、セルごとのアイテム生成を避ける）"""
+
+    HEADERS = ["ファイル", "状態", "サイズ", "時刻"]
+    TIME_COLUMN = 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._file_paths: List[str] = []
+        self._statuses: List[str] = []
+        self._sizes: List[str] = []
+        self._times: List[float] = []  # UNIX 時刻（表示時に文字列化）
+        self._columns = (self._file_paths, self._statuses, self._sizes, self._times)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """行数"""
+        if parent.isValid():
+            return 0
+        return len(self._file_paths)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """列数"""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """セルの表示データ"""
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        value = self._columns[index.column()][index.row()]
+        if index.column() == self.TIME_COLUMN:
+            # 時刻は表示される行のみ文字列化
+            return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S")
+        return value
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """ヘッダー表示データ"""
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def append_rows(self, rows: Iterable[Tuple[str, str, str, float]]):
+        """
+        行をまとめて追加（挿入通知は1回）
+
+        Args:
+            rows: (ファイル, 状態, サイズ, 時刻（UNIX 時刻）) のリスト
+        """
+        rows = list(rows)
+        if not rows:
+            return
+
+        first = len(self._file_paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for file_path, status, size, timestamp in rows:
+            self._file_paths.append(file_path)
+            self._statuses.append(status)
+            self._sizes.append(size)
+            self._times.append(timestamp)
+        self.endInsertRows()
+
+    def clear(self):
+        """全行を削除"""
+        self.beginResetModel()
+        for column in self._columns:
+            column.clear()
+        self.endResetModel()
+
+    def file_path(self, row: int) -> Optional[str]:
+        """指定行のファイルパスを取得"""
+        if 0 <= row < len(self._file_paths):
+            return self._file_paths[row]
+        return None
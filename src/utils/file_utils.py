@@ -3,38 +3,115 @@
 """
 
 import os
+import sys
 import shutil
+import stat
+import threading
+import time
 import fnmatch
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import count, repeat
 from pathlib import Path
-from typing import List, Optional, Tuple, Generator
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Generator
 from datetime import datetime
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+    fcntl = None
 
-def get_file_info(file_path: Path) -> dict:
+
+# Linux ではカーネル内コピー（copy_file_range / sendfile）を使用
+_LINUX = sys.platform.startswith('linux')
+_COPY_FILE_RANGE_AVAILABLE = _LINUX and hasattr(os, 'copy_file_range')
+_SENDFILE_AVAILABLE = _LINUX and hasattr(os, 'sendfile')
+_FADVISE_AVAILABLE = hasattr(os, 'posix_fadvise')
+# reflink（btrfs・xfs 等の CoW 対応FSでのデータ共有コピー）用 ioctl
+_FICLONE_AVAILABLE = _LINUX and FCNTL_AVAILABLE
+_FICLONE = getattr(fcntl, 'FICLONE', 0x40049409)
+
+# 通常コピー時のバッファサイズ（既定の 64 KiB では小さい）
+_COPY_BUFFER_SIZE = 1 << 20
+# これより大きいファイルはシーケンシャル読み込みをカーネルに通知
+_SEQUENTIAL_HINT_SIZE = 256 << 20
+
+# 同じ秒に作成されたバックアップの名前の重複回避用連番
+_backup_counter = count(1)
+
+# コピー用一時ファイル名の連番
+_tmp_counter = count(1)
+
+
+# format_file_size の単位
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# スレッドごとに再利用するコピーバッファ（ファイル・読み込みごとの確保を避ける）
+_copy_buffers = threading.local()
+
+
+class FileEntry(NamedTuple):
+    """スキャンで取得したファイル情報（stat 結果を保持して再取得を省く）"""
+    path: str  # ファイルパス文字列（DirEntry.path。Path オブジェクトは必要な箇所でのみ作成）
+    rel_path: str  # スキャン起点からの相対パス
+    size: int
+    mtime: float
+
+
+def get_file_info(file_path: Path, convert_times: bool = True) -> dict:
     """
     ファイル情報を取得
     
     Args:
         file_path: ファイルパス
+        convert_times: modified/created を datetime に変換するか
+            （False の場合は UNIX 時刻のまま。表示時に format_file_info_for_display で変換）
     
     Returns:
         ファイル情報辞書
     """
-    if not file_path.exists():
+    # 1回の stat で存在確認・種別判定・日時取得を行う
+    try:
+        file_stat = file_path.stat()
+    except OSError:
         return {}
     
-    stat = file_path.stat()
-    return {
+    # 拡張子は Path.suffix と同じ判定（先頭・末尾のドットは拡張子扱いしない）を文字列操作で行う
+    name = file_path.name
+    dot = name.rfind('.')
+    extension = name[dot:].lower() if 0 < dot < len(name) - 1 else ''
+    
+    info = {
         'path': str(file_path),
-        'name': file_path.name,
-        'size': stat.st_size,
-        'modified': datetime.fromtimestamp(stat.st_mtime),
-        'created': datetime.fromtimestamp(stat.st_ctime),
-        'is_file': file_path.is_file(),
-        'is_dir': file_path.is_dir(),
-        'extension': file_path.suffix.lower()
+        'name': name,
+        'size': file_stat.st_size,
+        'modified': file_stat.st_mtime,
+        'created': file_stat.st_ctime,
+        'is_file': stat.S_ISREG(file_stat.st_mode),
+        'is_dir': stat.S_ISDIR(file_stat.st_mode),
+        'extension': extension
     }
+    return format_file_info_for_display(info) if convert_times else info
+
+
+def format_file_info_for_display(info: dict) -> dict:
+    """
+    get_file_info(convert_times=False) の UNIX 時刻を datetime に変換
+    
+    Args:
+        info: ファイル情報辞書（この辞書を更新して返す）
+    
+    Returns:
+        modified/created が datetime のファイル情報辞書
+    """
+    for key in ('modified', 'created'):
+        value = info.get(key)
+        if isinstance(value, float):
+            info[key] = datetime.fromtimestamp(value)
+    return info
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -50,93 +127,282 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_units = ['B', 'KB', 'MB', 'GB', 'TB']
+    # 単位は 1024 = 2^10 ごとなのでビット長から直接求める
     i = 0
-    while size_bytes >= 1024.0 and i < len(size_units) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    if size_bytes >= 1024:
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
     
-    return f"{size_bytes:.1f} {size_units[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
-def is_file_newer(source_path: Path, target_path: Path) -> bool:
+def is_file_newer(
+    source_path: Path,
+    target_path: Path,
+    source_mtime: Optional[float] = None,
+    target_mtime: Optional[float] = None
+) -> bool:
     """
     ソースファイルがターゲットファイルより新しいかチェック
     
     Args:
         source_path: ソースファイルパス
         target_path: ターゲットファイルパス
+        source_mtime: 取得済みのソース更新日時（指定時はソースを stat しない）
+        target_mtime: 取得済みのターゲット更新日時（指定時はターゲットを stat しない）
     
     Returns:
         True if ソースが新しい or ターゲットが存在しない
     """
-    if not source_path.exists():
+    # 存在確認と更新日時取得は stat 1回で行う
+    if source_mtime is None:
+        try:
+            source_mtime = os.stat(source_path).st_mtime
+        except FileNotFoundError:
+            return False
+    
+    if target_mtime is None:
+        try:
+            target_mtime = os.stat(target_path).st_mtime
+        except FileNotFoundError:
+            return True
+    
+    return source_mtime > target_mtime
+
+
+def _get_copy_buffer() -> memoryview:
+    """現在のスレッドのコピーバッファを取得（初回のみ確保）"""
+    buffer = getattr(_copy_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _copy_buffers.buffer = memoryview(bytearray(_COPY_BUFFER_SIZE))
+    return buffer
+
+
+def _copy_file_data(source_path: Path, target_path: Path):
+    """
+    ファイル内容をコピー
+    
+    Linux では copy_file_range（reflink 対応FSではデータ転送なし）、sendfile の順に試し、
+    未対応の場合は通常の読み書きで残りをコピーする。
+    その他の環境では shutil.copyfile（macOS では fcopyfile）を使用する。
+    """
+    if not _LINUX:
+        shutil.copyfile(source_path, target_path)
+        return
+    
+    with open(source_path, 'rb') as fsrc, open(target_path, 'wb', buffering=_COPY_BUFFER_SIZE) as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        size = os.fstat(src_fd).st_size
+        offset = 0
+        
+        if _FADVISE_AVAILABLE and size > _SEQUENTIAL_HINT_SIZE:
+            try:
+                os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        
+        if _COPY_FILE_RANGE_AVAILABLE:
+            while offset < size:
+                try:
+                    copied = os.copy_file_range(src_fd, dst_fd, size - offset)
+                except OSError:
+                    break  # 未対応のFS・FS跨ぎなど
+                if copied == 0:
+                    break
+                offset += copied
+        
+        if _SENDFILE_AVAILABLE:
+            while offset < size:
+                try:
+                    copied = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                except OSError:
+                    break
+                if copied == 0:
+                    break
+                offset += copied
+        
+        # 残り（コピー中に追記された分を含む）を通常コピー
+        fsrc.seek(offset)
+        fdst.seek(offset)
+        buffer = _get_copy_buffer()
+        while True:
+            read_size = fsrc.readinto(buffer)
+            if not read_size:
+                break
+            fdst.write(buffer[:read_size])
+
+
+def _clone_file(source_path: Path, target_path: Path) -> bool:
+    """reflink でファイルをコピー（データブロックを共有。未対応のFS・FS跨ぎでは False）"""
+    if not _FICLONE_AVAILABLE:
         return False
     
-    if not target_path.exists():
+    try:
+        with open(source_path, 'rb') as fsrc, open(target_path, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
         return True
+    except OSError:
+        return False
+
+
+def _link_file(source_path: Path, target_path: Path) -> bool:
+    """既存のターゲットを置き換えてハードリンクを作成（失敗時は False）"""
+    try:
+        try:
+            os.unlink(target_path)
+        except FileNotFoundError:
+            pass
+        os.link(source_path, target_path)
+        return True
+    except OSError:
+        return False
+
+
+def _ensure_parent_directory(target_path: Path, created_dirs: Optional[Set[str]], refresh: bool = False):
+    """ターゲットの親ディレクトリを作成（created_dirs に記録済みのディレクトリは mkdir を省略）"""
+    parent = target_path.parent
+    if created_dirs is None:
+        parent.mkdir(parents=True, exist_ok=True)
+        return
     
-    source_mtime = source_path.stat().st_mtime
-    target_mtime = target_path.stat().st_mtime
-    
-    return source_mtime > target_mtime
+    # set の追加・参照はスレッドセーフのため、並行コピー中もロックは不要
+    key = str(parent)
+    if refresh or key not in created_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        created_dirs.add(key)
 
 
-def copy_file_with_metadata(source_path: Path, target_path: Path, preserve_timestamp: bool = True) -> bool:
+def _create_file_copy(source_path: Path, tmp_path: Path, allow_reflink: bool, allow_hardlink: bool):
+    """ソースの内容・メタデータを持つファイルを tmp_path に作成"""
+    # ハードリンクはソースと同じ inode のため、メタデータの複製は不要
+    if allow_hardlink:
+        try:
+            os.link(source_path, tmp_path)
+            return
+        except FileNotFoundError:
+            raise
+        except OSError:
+            pass  # FS 跨ぎ・ハードリンク非対応
+    
+    # ファイルコピー（内容コピー後に権限・タイムスタンプ等を複製）
+    # タイムスタンプは copystat がナノ秒精度で複製済みのため、再 stat・utime は行わない
+    # （shutil.copy2 を使っていた頃から preserve_timestamp に関わらず常に保持）
+    if not (allow_reflink and _clone_file(source_path, tmp_path)):
+        _copy_file_data(source_path, tmp_path)
+    shutil.copystat(source_path, tmp_path)
+
+
+def copy_file_with_metadata(
+    source_path: Path,
+    target_path: Path,
+    preserve_timestamp: bool = True,
+    allow_reflink: bool = False,
+    allow_hardlink: bool = False,
+    created_dirs: Optional[Set[str]] = None
+) -> bool:
     """
     ファイルをメタデータ付きでコピー
     
+    一時ファイルに書き込んでから os.replace で置き換えるため、
+    中断してもターゲットが書きかけの状態にならない（既存のターゲットは別 inode に置き換わる）。
+    
     Args:
         source_path: ソースファイルパス
         target_path: ターゲットファイルパス
-        preserve_timestamp: タイムスタンプ保持
+        preserve_timestamp: タイムスタンプ保持（互換用。タイムスタンプは常に保持される）
+        allow_reflink: 同一FS上では reflink でコピー（データを書き込まない）
+        allow_hardlink: 同一FS上ではハードリンクを作成（ソースとターゲットが同じ実体になる）
+        created_dirs: 作成済みのターゲットディレクトリの記録（同期1回分で共有し、ファイルごとの mkdir を省略）
     
     Returns:
         成功した場合 True
     """
+    # 一時ファイル名はプロセス ID と連番で一意にする（中断時の残骸と衝突しない）
+    tmp_path = target_path.with_name(f".{target_path.name}.{os.getpid()}.{next(_tmp_counter)}.part")
     try:
-        # ターゲットディレクトリを作成
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # ファイルコピー
-        shutil.copy2(source_path, target_path)
-        
-        # タイムスタンプ保持
-        if preserve_timestamp:
-            stat = source_path.stat()
-            os.utime(target_path, (stat.st_atime, stat.st_mtime))
+        _ensure_parent_directory(target_path, created_dirs)
+        try:
+            _create_file_copy(source_path, tmp_path, allow_reflink, allow_hardlink)
+        except FileNotFoundError:
+            if created_dirs is None:
+                raise
+            # 作成済みとして記録したディレクトリが同期中に削除されていた場合は作り直して再試行
+            _ensure_parent_directory(target_path, created_dirs, refresh=True)
+            _create_file_copy(source_path, tmp_path, allow_reflink, allow_hardlink)
         
+        os.replace(tmp_path, target_path)
         return True
     except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
         return False
 
 
-def backup_file(file_path: Path, backup_dir: Optional[Path] = None) -> Optional[Path]:
+def _unique_backup_path(backup_dir: Path, stem: str, timestamp: str, suffix: str) -> Path:
+    """同じ秒のバックアップと重ならないよう、プロセス ID と連番を付けたバックアップファイル名"""
+    return backup_dir / f"{stem}_{timestamp}_{os.getpid()}_{next(_backup_counter)}{suffix}"
+
+
+def backup_file(
+    file_path: Path,
+    backup_dir: Optional[Path] = None,
+    allow_hardlink: bool = False
+) -> Optional[Path]:
     """
     ファイルをバックアップ
     
     Args:
         file_path: バックアップするファイルパス
         backup_dir: バックアップディレクトリ
+        allow_hardlink: 同一FS上ではコピーせずハードリンクを作成する。
+            元ファイルをその場で書き換えるとバックアップも変わるため、
+            呼び出し側が元ファイルを別ファイルで置き換える（os.replace 等）場合のみ True にする
     
     Returns:
         バックアップファイルパス（失敗時は None）
     """
-    if not file_path.exists():
-        return None
-    
+    # 存在確認はコピー時のエラーで兼ねる（呼び出し側で存在確認済みのことが多いため stat を省く）
     try:
         if backup_dir is None:
             backup_dir = file_path.parent / "backup"
         
         backup_dir.mkdir(parents=True, exist_ok=True)
         
-        # タイムスタンプ付きバックアップファイル名
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
-        backup_path = backup_dir / backup_name
+        # タイムスタンプ付きバックアップファイル名（datetime は作らず time.strftime で整形）
+        stem = file_path.stem
+        suffix = file_path.suffix
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        backup_path = backup_dir / f"{stem}_{timestamp}{suffix}"
+        
+        if allow_hardlink:
+            try:
+                os.link(file_path, backup_path)
+                return backup_path
+            except FileExistsError:
+                backup_path = _unique_backup_path(backup_dir, stem, timestamp, suffix)
+                if _link_file(file_path, backup_path):
+                    return backup_path
+            except OSError:
+                pass  # FS 跨ぎ・ハードリンク非対応の場合はコピー
+        
+        # コピー先の名前は排他作成で確保（同じ秒に作成済みのバックアップを上書きしない）
+        try:
+            with open(backup_path, 'xb'):
+                pass
+        except FileExistsError:
+            backup_path = _unique_backup_path(backup_dir, stem, timestamp, suffix)
         
-        shutil.copy2(file_path, backup_path)
+        try:
+            shutil.copy2(file_path, backup_path)
+        except OSError:
+            # 確保した空ファイルを残さない
+            try:
+                os.unlink(backup_path)
+            except OSError:
+                pass
+            raise
         return backup_path
     except Exception:
         return None
@@ -154,45 +420,90 @@ def match_patterns(file_path: Path, include_patterns: List[str], exclude_pattern
     Returns:
         True if マッチ（コピー対象）
     """
-    file_name = file_path.name
-    file_path_str = str(file_path)
-    
-    # 除外パターンチェック（優先）
-    for pattern in exclude_patterns:
-        if pattern.startswith('regex:'):
-            # 正規表現パターン
-            regex_pattern = pattern[6:]  # "regex:" を除去
-            if re.search(regex_pattern, file_name, re.IGNORECASE):
-                return False
-        else:
-            # Globパターン
-            if fnmatch.fnmatch(file_name, pattern):
-                return False
-    
-    # 含むパターンが指定されていない場合は全て含む
-    if not include_patterns:
-        return True
+    file_filter = _get_cached_filter(tuple(include_patterns), tuple(exclude_patterns))
+    return file_filter.matches(file_path.name)
+
+
+class PatternMatcher:
+    """コンパイル済みパターン（Globはまとめて1つの正規表現に変換）"""
     
-    # 含むパターンチェック
-    for pattern in include_patterns:
-        if pattern.startswith('regex:'):
-            # 正規表現パターン
-            regex_pattern = pattern[6:]  # "regex:" を除去
-            if re.search(regex_pattern, file_name, re.IGNORECASE):
-                return True
-        else:
-            # Globパターン
-            if fnmatch.fnmatch(file_name, pattern):
+    def __init__(self, patterns: Iterable[str]):
+        glob_regexes = []
+        self._regexes = []
+        
+        for pattern in patterns:
+            if pattern.startswith('regex:'):
+                # 正規表現パターン（"regex:" を除去）
+                self._regexes.append(re.compile(pattern[6:], re.IGNORECASE))
+            else:
+                # Globパターン（fnmatch.fnmatch と同じく normcase して比較）
+                glob_regexes.append(fnmatch.translate(os.path.normcase(pattern)))
+        
+        self._glob_regex = re.compile('|'.join(glob_regexes)) if glob_regexes else None
+        self.is_empty = not glob_regexes and not self._regexes
+    
+    def matches(self, file_name: str) -> bool:
+        """ファイル名がいずれかのパターンにマッチするかチェック"""
+        if self._glob_regex is not None and self._glob_regex.match(os.path.normcase(file_name)):
+            return True
+        
+        for regex in self._regexes:
+            if regex.search(file_name):
                 return True
+        
+        return False
+
+
+class FileFilter:
+    """コンパイル済みの含む/除外パターンによるファイルフィルタ"""
+    
+    def __init__(
+        self,
+        include_patterns: Iterable[str],
+        exclude_patterns: Iterable[str],
+        exclude_dirs: Iterable[str] = ()
+    ):
+        self.include = PatternMatcher(include_patterns)
+        self.exclude = PatternMatcher(exclude_patterns)
+        self.exclude_dir = PatternMatcher(exclude_dirs)
+    
+    def matches(self, file_name: str) -> bool:
+        """
+        ファイル名がフィルタにマッチするかチェック（match_patterns と同じ判定）
+        
+        Args:
+            file_name: ファイル名
+        
+        Returns:
+            True if マッチ（コピー対象）
+        """
+        # 除外パターンチェック（優先）
+        if self.exclude.matches(file_name):
+            return False
+        
+        # 含むパターンが指定されていない場合は全て含む
+        if self.include.is_empty:
+            return True
+        
+        return self.include.matches(file_name)
     
-    return False
+    def skips_dir(self, dir_name: str) -> bool:
+        """サブディレクトリを走査対象から外すかチェック（配下は scandir しない）"""
+        return not self.exclude_dir.is_empty and self.exclude_dir.matches(dir_name)
+
+
+@lru_cache(maxsize=64)
+def _get_cached_filter(include_patterns: Tuple[str, ...], exclude_patterns: Tuple[str, ...]) -> FileFilter:
+    """パターンの組み合わせごとにコンパイル済みフィルタを再利用（match_patterns 用）"""
+    return FileFilter(include_patterns, exclude_patterns)
 
 
 def scan_directory(
     directory: Path,
     include_patterns: List[str] = None,
     exclude_patterns: List[str] = None,
-    recursive: bool = True
+    recursive: bool = True,
+    exclude_dirs: List[str] = None
 ) -> Generator[Path, None, None]:
     """
     ディレクトリをスキャンしてマッチするファイルを列挙
@@ -202,31 +513,174 @@ def scan_directory(
         include_patterns: 含むパターンリスト
         exclude_patterns: 除外パターンリスト
         recursive: 再帰的スキャン
+        exclude_dirs: 配下を走査しないサブディレクトリ名のパターンリスト
     
     Yields:
         マッチするファイルパス
     """
-    if not directory.exists() or not directory.is_dir():
+    for entry in scan_directory_entries(
+        directory, include_patterns, exclude_patterns, recursive, exclude_dirs=exclude_dirs
+    ):
+        yield Path(entry.path)
+
+
+def scan_directory_entries(
+    directory: Path,
+    include_patterns: List[str] = None,
+    exclude_patterns: List[str] = None,
+    recursive: bool = True,
+    file_filter: Optional[FileFilter] = None,
+    max_workers: int = 1,
+    exclude_dirs: List[str] = None,
+    stop_event: Optional[threading.Event] = None
+) -> Generator[FileEntry, None, None]:
+    """
+    ディレクトリをスキャンしてマッチするファイルを stat 情報付きで列挙
+    
+    Args:
+        directory: スキャンするディレクトリ
+        include_patterns: 含むパターンリスト
+        exclude_patterns: 除外パターンリスト
+        recursive: 再帰的スキャン
+        file_filter: コンパイル済みフィルタ（指定時はパターンリストより優先）
+        max_workers: 直下のサブディレクトリを並行スキャンするスレッド数（1 の場合は逐次）
+        exclude_dirs: 配下を走査しないサブディレクトリ名のパターンリスト（file_filter 指定時は無視）
+        stop_event: セットされると以降のディレクトリを走査せずに終了（並行スキャンのワーカーも含む）
+    
+    Yields:
+        マッチするファイルの FileEntry（パス・サイズ・更新日時）
+    """
+    if not directory.is_dir():
         return
     
-    if include_patterns is None:
-        include_patterns = []
-    if exclude_patterns is None:
-        exclude_patterns = []
+    if file_filter is None:
+        file_filter = FileFilter(include_patterns or [], exclude_patterns or [], exclude_dirs or [])
+    
+    root = str(directory)
+    if recursive and max_workers > 1:
+        yield from _scan_tree_parallel(root, file_filter, max_workers, stop_event)
+    else:
+        yield from _scan_tree(root, file_filter, recursive, stop_event=stop_event)
+
+
+def _scan_entries(
+    directory: str,
+    file_filter: FileFilter,
+    files: List[FileEntry],
+    subdirs: List[str],
+    prefix_len: int
+):
+    """
+    1つのディレクトリを os.scandir で走査し、マッチしたファイルとサブディレクトリを振り分け
+    
+    相対パスは DirEntry.path の先頭 prefix_len 文字（スキャン起点 + 区切り文字）を除いて作成する。
     
+    DirEntry が保持するファイル種別を使うため、stat はマッチしたファイルのサイズ・更新日時取得の1回のみ。
+    ディレクトリへのシンボリックリンクは辿らない（Path.rglob と同じ）。
+    file_filter.skips_dir に該当するサブディレクトリは配下ごと走査しない。
+    """
     try:
-        if recursive:
-            for file_path in directory.rglob("*"):
-                if file_path.is_file():
-                    if match_patterns(file_path, include_patterns, exclude_patterns):
-                        yield file_path
-        else:
-            for file_path in directory.iterdir():
-                if file_path.is_file():
-                    if match_patterns(file_path, include_patterns, exclude_patterns):
-                        yield file_path
-    except PermissionError:
-        pass  # アクセス権限のないディレクトリはスキップ
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not file_filter.skips_dir(entry.name):
+                            subdirs.append(entry.path)
+                        continue
+                    
+                    if not file_filter.matches(entry.name) or not entry.is_file():
+                        continue
+                    
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                
+                entry_path = entry.path
+                files.append(FileEntry(
+                    entry_path, entry_path[prefix_len:], entry_stat.st_size, entry_stat.st_mtime
+                ))
+    except OSError:
+        pass  # アクセス権限のないディレクトリ等はスキップ
+
+
+def _scan_tree(
+    directory: str,
+    file_filter: FileFilter,
+    recursive: bool = True,
+    prefix_len: Optional[int] = None,
+    stop_event: Optional[threading.Event] = None
+) -> Generator[FileEntry, None, None]:
+    """スタック走査でディレクトリ配下のマッチするファイルを列挙（stop_event がセットされたら中断）"""
+    if prefix_len is None:
+        prefix_len = len(os.path.join(directory, ''))
+    
+    stack = [directory]
+    while stack:
+        if stop_event is not None and stop_event.is_set():
+            return
+        files = []
+        _scan_entries(stack.pop(), file_filter, files, stack if recursive else [], prefix_len)
+        yield from files
+
+
+def _collect_tree(
+    directory: str,
+    file_filter: FileFilter,
+    prefix_len: int,
+    stop_event: Optional[threading.Event] = None
+) -> List[FileEntry]:
+    """ディレクトリ配下のマッチするファイルをリストで取得（ワーカースレッド用）"""
+    return list(_scan_tree(directory, file_filter, prefix_len=prefix_len, stop_event=stop_event))
+
+
+def _scan_tree_parallel(
+    root: str,
+    file_filter: FileFilter,
+    max_workers: int,
+    stop_event: Optional[threading.Event] = None
+) -> Generator[FileEntry, None, None]:
+    """直下のサブディレクトリごとにスレッドで並行走査（I/O 待ちの長いドライブ向け）"""
+    prefix_len = len(os.path.join(root, ''))
+    files = []
+    subdirs = []
+    _scan_entries(root, file_filter, files, subdirs, prefix_len)
+    yield from files
+    
+    if len(subdirs) < 2:
+        for subdir in subdirs:
+            yield from _scan_tree(subdir, file_filter, prefix_len=prefix_len, stop_event=stop_event)
+        return
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(subdirs))) as executor:
+        for subtree_files in executor.map(
+            _collect_tree, subdirs, repeat(file_filter), repeat(prefix_len), repeat(stop_event)
+        ):
+            yield from subtree_files
+
+
+def snapshot_file_mtimes(
+    directory: Path,
+    max_workers: int = 1,
+    stop_event: Optional[threading.Event] = None
+) -> Dict[str, float]:
+    """
+    ディレクトリ配下の全ファイルの更新日時を一括取得
+    
+    Args:
+        directory: スキャンするディレクトリ
+        max_workers: 並行スキャンするスレッド数
+        stop_event: セットされると走査を打ち切る（結果は途中までの不完全なものになる）
+    
+    Returns:
+        os.path.normcase したファイルパス文字列 -> 更新日時
+    """
+    file_filter = FileFilter([], [])
+    return {
+        os.path.normcase(entry.path): entry.mtime
+        for entry in scan_directory_entries(
+            directory, file_filter=file_filter, max_workers=max_workers, stop_event=stop_event
+        )
+    }
 
 
 def calculate_directory_size(directory: Path) -> Tuple[int, int]:
@@ -242,13 +696,10 @@ def calculate_directory_size(directory: Path) -> Tuple[int, int]:
     total_size = 0
     file_count = 0
     
-    try:
-        for file_path in directory.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-                file_count += 1
-    except PermissionError:
-        pass  # アクセス権限のないファイルはスキップ
+    # os.scandir で走査し、stat はファイルごとに1回のみ（アクセス権限のないディレクトリはスキップ）
+    for entry in scan_directory_entries(directory, file_filter=FileFilter([], [])):
+        total_size += entry.size
+        file_count += 1
     
     return total_size, file_count
 
@@ -280,9 +731,11 @@ def safe_delete_file(file_path: Path) -> bool:
     Returns:
         成功した場合 True
     """
+    # 存在確認の stat は行わず、削除時のエラーで判定
     try:
-        if file_path.exists():
-            file_path.unlink()
+        os.unlink(file_path)
+        return True
+    except FileNotFoundError:
         return True
     except Exception:
         return False
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+JSONシリアライズユーティリティ
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def json_dumps(data: Any, indent: bool = True) -> bytes:
+    """
+    データをUTF-8のJSONバイト列に変換
+
+    Args:
+        data: 変換するデータ
+        indent: インデント（2スペース）付きで出力
+
+    Returns:
+        JSONバイト列
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    # orjson と同じく区切りの空白も省く
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    JSONバイト列をデータに変換
+
+    Args:
+        data: JSONバイト列
+
+    Returns:
+        変換されたデータ
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -2,11 +2,42 @@
 ログシステム - ローテーション付き
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
+
+
+# プロジェクトルート（既定のログディレクトリ data/logs の基準）
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# 作成済みのログディレクトリ（再セットアップ時の mkdir を省略）
+_created_log_dirs: Set[Path] = set()
+
+# ロガー名ごとのキューリスナー（ファイル・コンソール出力を専用スレッドで実行）
+_queue_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_queue_listener(name: str):
+    """キューリスナーを停止（未出力のログを書き出してからハンドラーを閉じる）"""
+    listener = _queue_listeners.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _stop_all_queue_listeners():
+    """全キューリスナーを停止（終了時）"""
+    for name in list(_queue_listeners):
+        _stop_queue_listener(name)
+
+
+atexit.register(_stop_all_queue_listeners)
 
 
 class ColoredFormatter(logging.Formatter):
@@ -22,14 +53,23 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'      # リセット
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 色付きレベル名はレベルごとに1回だけ作成
+        reset = self.COLORS['RESET']
+        self._colored_levels = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+    
     def format(self, record):
-        # 色付きレベル名を作成
+        # 色付きレベル名に差し替えて整形し、他のハンドラー用に元に戻す
         level_name = record.levelname
-        if level_name in self.COLORS:
-            colored_level = f"{self.COLORS[level_name]}{level_name}{self.COLORS['RESET']}"
-            record.levelname = colored_level
-        
-        return super().format(record)
+        record.levelname = self._colored_levels.get(level_name, level_name)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = level_name
 
 
 def setup_logger(
@@ -57,17 +97,19 @@ def setup_logger(
     
     # ログディレクトリの設定
     if log_dir is None:
-        current_dir = Path(__file__).parent.parent.parent
-        log_dir = current_dir / "data" / "logs"
+        log_dir = _PROJECT_ROOT / "data" / "logs"
     
     log_dir = Path(log_dir)
-    log_dir.mkdir(parents=True, exist_ok=True)
+    if log_dir not in _created_log_dirs:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        _created_log_dirs.add(log_dir)
     
     # ロガー作成
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
     # 既存のハンドラーをクリア
+    _stop_queue_listener(name)
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     
@@ -86,7 +128,7 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    handlers = [file_handler]
     
     # コンソールハンドラー
     if console_output:
@@ -96,7 +138,15 @@ def setup_logger(
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # ロガーにはキューへの投入のみ行うハンドラーを登録し、書き込み・ローテーションはリスナースレッドで実行
+    # （同期中のワーカースレッドがファイル書き込みのロック待ちにならない）
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners[name] = listener
     
     # 初期ログ出力
     logger.info(f"ログシステム初期化完了 - ログファイル: {log_file}")
@@ -131,7 +181,7 @@ class LogContext:
     def __enter__(self):
         import time
         self.start_time = time.time()
-        self.logger.info(f"開始: {self.operation}")
+        self.logger.info("開始: %s", self.operation)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -139,14 +189,14 @@ class LogContext:
         duration = time.time() - self.start_time
         
         if exc_type is None:
-            self.logger.info(f"完了: {self.operation} ({duration:.2f}秒)")
+            self.logger.info("完了: %s (%.2f秒)", self.operation, duration)
         else:
-            self.logger.error(f"エラー: {self.operation} - {exc_val} ({duration:.2f}秒)")
+            self.logger.error("エラー: %s - %s (%.2f秒)", self.operation, exc_val, duration)
     
     def log_progress(self, message: str, level: str = "INFO"):
         """進捗ログを出力"""
         log_func = getattr(self.logger, level.lower(), self.logger.info)
-        log_func(f"[{self.operation}] {message}")
+        log_func("[%s] %s", self.operation, message)
 
 
 # グローバルロガーインスタンス
@@ -179,6 +229,6 @@ def log_error(message: str):
 
 
 def log_debug(message: str):
-    """デバッグログを出力"""
-    if _global_logger:
+    """デバッグログを出力（DEBUG 無効時はレコードを作らない）"""
+    if _global_logger and _global_logger.isEnabledFor(logging.DEBUG):
         _global_logger.debug(message)
\ No newline at end of file